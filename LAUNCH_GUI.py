@@ -2,24 +2,34 @@
 """Launch Mozart Dueling AI"""
 import os
 import sys
-from pathlib import Path
 
-# Change to script directory
-os.chdir(Path(__file__).parent)
+# Change to script directory (skipped when already launched from there)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if os.getcwd() != _HERE:
+    os.chdir(_HERE)
 
-# Import and run Mozart
-try:
-    import mozart_monitorV10
-    if hasattr(mozart_monitorV10, 'main'):
-        mozart_monitorV10.main()
-    else:
-        # If no main function, run the GUI directly
-        print("Starting Mozart Dueling AI GUI...")
-        exec(open('mozart_monitorV10.py').read())
-except ImportError as e:
-    print(f"Error: {e}")
-    print("Please run setup.py first to install dependencies.")
-    sys.exit(1)
-except Exception as e:
-    print(f"Error starting Mozart: {e}")
-    sys.exit(1)
+
+def _run():
+    """Import and run Mozart (deferred so the GUI/HTTP stack only loads on launch)"""
+    try:
+        import mozart_monitorV10
+        main = getattr(mozart_monitorV10, 'main', None)
+        if main is not None:
+            main()
+        else:
+            # If no main function, run the module as a script so its
+            # __main__ block starts the GUI (cached bytecode is reused)
+            import runpy
+            print("Starting Mozart Dueling AI GUI...")
+            runpy.run_module("mozart_monitorV10", run_name="__main__")
+    except ImportError as e:
+        print(f"Error: {e}")
+        print("Please run setup.py first to install dependencies.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error starting Mozart: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    _run()
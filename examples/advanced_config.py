@@ -6,16 +6,25 @@ This example shows how to configure Mozart AI V10 for specialized
 review scenarios with custom settings.
 """
 
+import functools
 import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 
-def create_custom_env_config():
-    """
-    Create a custom environment configuration for specialized reviews.
-    """
-    
-    # Example: Security-focused configuration
-    security_config = """
+__all__ = [
+    "SECURITY_CONFIG",
+    "PERFORMANCE_CONFIG",
+    "RuntimeConfig",
+    "load_runtime_config",
+    "create_custom_env_config",
+    "demonstrate_criteria_combinations",
+    "advanced_usage_tips",
+    "main",
+]
+
+# Example: Security-focused configuration
+SECURITY_CONFIG = """
 # Security-Focused Mozart AI Configuration
 
 # API Keys
@@ -49,8 +58,8 @@ LOG_LEVEL=DEBUG
 AGENT_NAME=Mozart Security Audit
 """
 
-    # Example: Performance-focused configuration
-    performance_config = """
+# Example: Performance-focused configuration
+PERFORMANCE_CONFIG = """
 # Performance-Focused Mozart AI Configuration
 
 # API Keys
@@ -76,74 +85,108 @@ LOG_LEVEL=INFO
 AGENT_NAME=Mozart Performance Analyzer
 """
 
-    return security_config, performance_config
+# Suggested review mode, keyed by how many criteria a scenario covers
+_SUGGESTIONS = {
+    "fast": "Fast Mode (quick competitive review)",
+    "full": "Full Mode (comprehensive with judge)",
+    "either": "Either mode (balanced analysis)",
+}
+
+# Criteria combinations for specialized reviews: (criteria, suggestion key)
+_SCENARIOS = {
+    "Security Audit": (
+        ("security", "error handling", "logic", "correctness"),
+        "either"
+    ),
+    "Performance Review": (
+        ("performance", "scalability", "logic", "design"),
+        "either"
+    ),
+    "Code Quality Assessment": (
+        ("clarity", "maintainability", "documentation", "design"),
+        "either"
+    ),
+    "Comprehensive Review": (
+        ("correctness", "security", "performance", "clarity", 
+         "maintainability", "logic", "error handling", "testing",
+         "scalability", "documentation", "design"),
+        "full"
+    ),
+    "Quick Sanity Check": (
+        ("correctness", "logic", "clarity"),
+        "fast"
+    ),
+    "Production Readiness": (
+        ("correctness", "security", "error handling", "testing", "scalability"),
+        "either"
+    )
+}
+
+# Layout of one entry printed by advanced_usage_tips()
+_TIP_TEMPLATE = "\n\n{i}. {title}:\n   {description}\n   Example: {example}"
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """Runtime settings read from the environment (see .env.mozart.example)."""
+    timeout_seconds: int = 60
+    log_level: str = "INFO"
+    agent_name: str = "Mozart"
+
+@functools.lru_cache(maxsize=1)
+def load_runtime_config() -> RuntimeConfig:
+    """
+    Read TIMEOUT_SECONDS, LOG_LEVEL and AGENT_NAME once and cache the result.
+    
+    Prefer this over ad-hoc os.getenv() calls so the values are only
+    parsed on first use.
+    """
+    return RuntimeConfig(
+        timeout_seconds=int(os.getenv("TIMEOUT_SECONDS", "60")),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        agent_name=os.getenv("AGENT_NAME", "Mozart"),
+    )
+
+def create_custom_env_config():
+    """
+    Create a custom environment configuration for specialized reviews.
+    """
+    return SECURITY_CONFIG, PERFORMANCE_CONFIG
 
 def demonstrate_criteria_combinations():
     """
     Show different criteria combinations for specialized reviews.
     """
+    out = []
     
-    review_scenarios = {
-        "Security Audit": [
-            "security", "error handling", "logic", "correctness"
-        ],
-        "Performance Review": [
-            "performance", "scalability", "logic", "design"
-        ],
-        "Code Quality Assessment": [
-            "clarity", "maintainability", "documentation", "design"
-        ],
-        "Comprehensive Review": [
-            "correctness", "security", "performance", "clarity", 
-            "maintainability", "logic", "error handling", "testing",
-            "scalability", "documentation", "design"
-        ],
-        "Quick Sanity Check": [
-            "correctness", "logic", "clarity"
-        ],
-        "Production Readiness": [
-            "correctness", "security", "error handling", "testing", "scalability"
-        ]
-    }
-    
-    print("=== Mozart AI Advanced Configuration Examples ===\n")
+    out.append("=== Mozart AI Advanced Configuration Examples ===\n")
     
-    print("🔧 Configuration Scenarios:")
+    out.append("🔧 Configuration Scenarios:")
     security_config, performance_config = create_custom_env_config()
     
-    print("\n1. Security-Focused Configuration:")
-    print("   - Specialized reviewer names (Security Auditor, Penetration Tester)")
-    print("   - Extended timeout for thorough analysis")
-    print("   - Debug logging for detailed security insights")
+    out.append("\n1. Security-Focused Configuration:")
+    out.append("   - Specialized reviewer names (Security Auditor, Penetration Tester)")
+    out.append("   - Extended timeout for thorough analysis")
+    out.append("   - Debug logging for detailed security insights")
     
-    print("\n2. Performance-Focused Configuration:")
-    print("   - Performance-specialized reviewer names")
-    print("   - Optimized timeout settings")
-    print("   - Custom agent branding")
+    out.append("\n2. Performance-Focused Configuration:")
+    out.append("   - Performance-specialized reviewer names")
+    out.append("   - Optimized timeout settings")
+    out.append("   - Custom agent branding")
     
-    print("\n📋 Review Scenario Criteria Combinations:")
-    for scenario, criteria in review_scenarios.items():
-        print(f"\n• {scenario}:")
-        print(f"  Criteria: {', '.join(criteria)}")
-        print(f"  Count: {len(criteria)} of 11 available")
-        
-        # Suggest mode based on criteria count
-        if len(criteria) <= 3:
-            mode_suggestion = "Fast Mode (quick competitive review)"
-        elif len(criteria) >= 8:
-            mode_suggestion = "Full Mode (comprehensive with judge)"
-        else:
-            mode_suggestion = "Either mode (balanced analysis)"
-        
-        print(f"  Suggested Mode: {mode_suggestion}")
+    out.append("\n📋 Review Scenario Criteria Combinations:")
+    for scenario, (criteria, suggestion) in _SCENARIOS.items():
+        criteria_text = ", ".join(criteria)
+        out.append(f"\n• {scenario}:")
+        out.append(f"  Criteria: {criteria_text}")
+        out.append(f"  Count: {len(criteria)} of 11 available")
+        out.append(f"  Suggested Mode: {_SUGGESTIONS[suggestion]}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def advanced_usage_tips():
     """
     Provide advanced tips for using Mozart AI effectively.
     """
-    
-    print("\n🎯 Advanced Usage Tips:")
-    
     tips = [
         {
             "title": "API Key Management",
@@ -177,10 +220,11 @@ def advanced_usage_tips():
         }
     ]
     
-    for i, tip in enumerate(tips, 1):
-        print(f"\n{i}. {tip['title']}:")
-        print(f"   {tip['description']}")
-        print(f"   Example: {tip['example']}")
+    sys.stdout.write(
+        "\n🎯 Advanced Usage Tips:"
+        + "".join(_TIP_TEMPLATE.format_map({"i": i, **tip}) for i, tip in enumerate(tips, 1))
+        + "\n"
+    )
 
 def main():
     """
@@ -189,6 +233,12 @@ def main():
     demonstrate_criteria_combinations()
     advanced_usage_tips()
     
+    config = load_runtime_config()
+    print(f"\n⚙️ Current Runtime Settings:")
+    print(f"   Agent name: {config.agent_name}")
+    print(f"   Timeout: {config.timeout_seconds}s")
+    print(f"   Log level: {config.log_level}")
+    
     print(f"\n🚀 Next Steps:")
     print("1. Copy .env.mozart.example to .env.mozart")
     print("2. Configure with your API keys and preferred settings")
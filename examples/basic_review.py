@@ -7,10 +7,8 @@ using Mozart AI V10 with basic configuration.
 """
 
 import sys
-import os
 
-# Add the parent directory to the path to import mozart_monitorV10
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+__all__ = ["basic_review_example"]
 
 def basic_review_example():
     """
@@ -37,27 +35,32 @@ print(f"Fibonacci of 10 is: {result}")
     context = "Python function that should efficiently calculate Fibonacci numbers"
     criteria = ["correctness", "performance", "clarity"]
     
-    print("=== Mozart AI Basic Review Example ===")
-    print(f"Goal: {goal}")
-    print(f"Context: {context}")
-    print(f"Selected Criteria: {', '.join(criteria)}")
-    print(f"Code Length: {len(code_to_review)} characters")
-    print("\nCode to Review:")
-    print("-" * 40)
-    print(code_to_review)
-    print("-" * 40)
-    
-    print("\n📝 To run this review:")
-    print("1. Start Mozart AI: python mozart_monitorV10.py")
-    print("2. Paste the goal, context, and code above")
-    print("3. Select 'correctness', 'performance', and 'clarity' criteria")
-    print("4. Choose Fast Mode or Full Mode")
-    print("5. Click 'Evaluate'")
-    
-    print("\n🎯 Expected Analysis Areas:")
-    print("- Correctness: Recursive logic implementation")
-    print("- Performance: Exponential time complexity issues")
-    print("- Clarity: Function naming and documentation")
+    criteria_text = ", ".join(criteria)
+    out = []
+    
+    out.append("=== Mozart AI Basic Review Example ===")
+    out.append(f"Goal: {goal}")
+    out.append(f"Context: {context}")
+    out.append(f"Selected Criteria: {criteria_text}")
+    out.append(f"Code Length: {len(code_to_review)} characters")
+    out.append("\nCode to Review:")
+    out.append("-" * 40)
+    out.append(code_to_review)
+    out.append("-" * 40)
+    
+    out.append("\n📝 To run this review:")
+    out.append("1. Start Mozart AI: python mozart_monitorV10.py")
+    out.append("2. Paste the goal, context, and code above")
+    out.append("3. Select 'correctness', 'performance', and 'clarity' criteria")
+    out.append("4. Choose Fast Mode or Full Mode")
+    out.append("5. Click 'Evaluate'")
+    
+    out.append("\n🎯 Expected Analysis Areas:")
+    out.append("- Correctness: Recursive logic implementation")
+    out.append("- Performance: Exponential time complexity issues")
+    out.append("- Clarity: Function naming and documentation")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     basic_review_example()
\ No newline at end of file
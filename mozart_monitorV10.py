@@ -1,32 +1,53 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import codecs
+import functools
+import hashlib
+import io
+import itertools
 import json
+import math
 import os
-import queue
 import threading
-import webbrowser
+from collections import OrderedDict, deque
+from concurrent.futures import Future, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, messagebox
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Optional: faster JSON encode/decode for API payloads
+except ImportError:
+    orjson = None
+
+try:
+    import httpx  # Optional: HTTP/2 transport, enabled with USE_HTTP2=1 (needs httpx[http2])
+except ImportError:
+    httpx = None
+
 # ────────────────────────────────────────────────────────────────────────
 # Env
 HERE = Path(__file__).parent
-for cand in (HERE / ".env.mozart", HERE / "env.mozart"):
-    if cand.exists():
-        load_dotenv(dotenv_path=cand)
-        break
-else:
-    load_dotenv()
+_ENV_PATH = HERE / ".env.mozart"
+if not _ENV_PATH.is_file():
+    _ENV_PATH = HERE / "env.mozart"  # Legacy name
+load_dotenv(_ENV_PATH if _ENV_PATH.is_file() else None)
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 TIMEOUT = int(os.getenv("TIMEOUT_SECONDS", "60"))
 AGENT_NAME = os.getenv("AGENT_NAME", "Mozart")
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE", "1") != "0"
+SPECULATIVE_SOLUTION = os.getenv("SPECULATIVE_SOLUTION", "0") == "1"
+USE_HTTP2 = os.getenv("USE_HTTP2", "0") == "1"
+WARM_CONNECTIONS = os.getenv("WARM_CONNECTIONS", "0") == "1"
 
 # Providers + bases
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
@@ -50,11 +71,12 @@ REVIEWER_B_MODEL = os.getenv("REVIEWER_B_MODEL", DEEPSEEK_MODEL_DEFAULT)
 JUDGE_PROVIDER = os.getenv("JUDGE_PROVIDER", "openai").lower()
 JUDGE_MODEL = os.getenv("JUDGE_MODEL", OPENAI_MODEL_DEFAULT)
 
-# Fail early if keys are missing for the selected providers
-if "deepseek" in (REVIEWER_A_PROVIDER, REVIEWER_B_PROVIDER, JUDGE_PROVIDER) and not DEEPSEEK_API_KEY:
-    raise SystemExit("Missing DEEPSEEK_API_KEY in server/.env.mozart")
-if "openai" in (REVIEWER_A_PROVIDER, REVIEWER_B_PROVIDER, JUDGE_PROVIDER) and not OPENAI_API_KEY:
-    raise SystemExit("Missing OPENAI_API_KEY in server/.env.mozart")
+def _validate_keys() -> None:
+    """Fail early if keys are missing for the selected providers"""
+    if "deepseek" in (REVIEWER_A_PROVIDER, REVIEWER_B_PROVIDER, JUDGE_PROVIDER) and not DEEPSEEK_API_KEY:
+        raise SystemExit("Missing DEEPSEEK_API_KEY in server/.env.mozart")
+    if "openai" in (REVIEWER_A_PROVIDER, REVIEWER_B_PROVIDER, JUDGE_PROVIDER) and not OPENAI_API_KEY:
+        raise SystemExit("Missing OPENAI_API_KEY in server/.env.mozart")
 
 # ────────────────────────────────────────────────────────────────────────
 # Review criteria options (all default ON per your request)
@@ -71,74 +93,119 @@ CHECK_OPTIONS = [
     "documentation",
     "design",
 ]
+CHECK_OPTIONS_SET = frozenset(CHECK_OPTIONS)
+
+# Width (in characters) of the score-row text column: "Maintainability:"
+_SCORE_LABEL_WIDTH = max(len(c) for c in CHECK_OPTIONS) + 1
+
+# Emoji shown next to each criterion on the score cards
+_CRITERIA_EMOJIS = {
+    "correctness": "✅", "security": "🔒", "performance": "⚡", 
+    "clarity": "📖", "maintainability": "🔧", "logic": "🧠",
+    "error handling": "🛡️", "testing": "🧪", "scalability": "📈",
+    "documentation": "📝", "design": "🎨"
+}
+
+# One-line description of each criterion for the exported report
+CRITERION_DESCRIPTIONS = {
+    "correctness": "Code accuracy, logic soundness, and correct implementation",
+    "security": "Vulnerability assessment, secure coding practices, data protection",
+    "performance": "Efficiency, speed optimization, resource usage, scalability",
+    "clarity": "Code readability, naming conventions, structure organization",
+    "maintainability": "Future-proofing, modularity, ease of modification",
+    "logic": "Reasoning flow, algorithm design, decision-making processes",
+    "error handling": "Exception management, edge cases, fault tolerance",
+    "testing": "Test coverage, testability, quality assurance approaches",
+    "scalability": "Growth handling, load management, architectural flexibility",
+    "documentation": "Code comments, API docs, usage examples, explanations",
+    "design": "Architecture patterns, design principles, structural quality"
+}
+
+# JSON score key for each criterion (e.g. "error handling" -> "error_handling")
+_NORMALIZE_TBL = str.maketrans({" ": "_", "-": "_"})
+
+@functools.lru_cache(maxsize=None)
+def _criterion_key(criterion: str) -> str:
+    """Normalize a criterion name into its JSON score key (memoized; names come from a small set)"""
+    return criterion.translate(_NORMALIZE_TBL).lower()
+
+# CRITERION_DESCRIPTIONS keyed by JSON score key
+_DESCRIPTIONS_BY_KEY = {_criterion_key(c): d for c, d in CRITERION_DESCRIPTIONS.items()}
 
 # ────────────────────────────────────────────────────────────────────────
 # System prompts
 
+# Constant prompt text; only the {scores} schema fragment varies per criteria set
+_CRITIC_TEMPLATE = (
+    "You are a principal engineer reviewing another AI assistant's reply.\n"
+    "Return STRICT JSON ONLY with this schema:\n"
+    "{{"
+    "\"summary\":\"\","
+    "\"grade\":\"approve|revise\","
+    "\"scores\":{{{scores}}},"
+    "\"issues\":[{{\"type\":\"bug|security|style|perf|design\",\"severity\":\"low|medium|high\",\"msg\":\"\",\"snippet\":\"\"}}],"
+    "\"improvements\":[],"
+    "\"tests_suggested\":[]"
+    "}}\n"
+    "IMPORTANT: You must provide numeric scores (0-10) for ALL criteria in the scores schema above.\n"
+    "Each score should reflect how well the reply addresses that specific criterion.\n"
+    "Use the full 0-10 range: 0-3=poor, 4-6=adequate, 7-8=good, 9-10=excellent.\n"
+    "Consider all criteria equally important unless the context suggests otherwise."
+)
+
+_JUDGE_TEMPLATE = (
+    "You are a staff engineer who merges two code reviews into one final, neutral report.\n"
+    "Return STRICT JSON ONLY with this schema:\n"
+    "{{"
+    "\"summary\":\"\","
+    "\"grade\":\"approve|revise\","
+    "\"winner\":\"A|B|tie\","
+    "\"reason\":\"\","
+    "\"scores\":{{{scores}}},"
+    "\"top_issues\":[{{\"type\":\"bug|security|style|perf|design\",\"severity\":\"low|medium|high\",\"msg\":\"\",\"snippet\":\"\"}}],"
+    "\"recommended_changes\":[],"
+    "\"tests_suggested\":[],"
+    "\"notes\":[]"
+    "}}\n"
+    "IMPORTANT: Provide balanced scores (0-10) for every criterion in the scores schema above.\n"
+    "Consider both reviews carefully and merge their insights into comprehensive scores.\n"
+    "The winner should be the review with better overall analysis, not just higher scores."
+)
+
 def get_critic_system(selected_criteria: List[str]) -> str:
     """Generate dynamic CRITIC_SYSTEM prompt based on selected review criteria"""
-    # Create dynamic scores schema based on selected criteria
-    scores_schema = {}
-    for criterion in selected_criteria:
-        # Normalize criterion name for JSON key (replace spaces with underscores)
-        key = criterion.replace(" ", "_").replace("-", "_").lower()
-        scores_schema[key] = "0-10"
-    
-    scores_json = ",".join([f'"{k}":0-10' for k in scores_schema.keys()])
-    
-    return (
-        "You are a principal engineer reviewing another AI assistant's reply.\n"
-        "Return STRICT JSON ONLY with this schema:\n"
-        "{"
-        "\"summary\":\"\","
-        "\"grade\":\"approve|revise\","
-        f"\"scores\":{{{scores_json}}},"
-        "\"issues\":[{\"type\":\"bug|security|style|perf|design\",\"severity\":\"low|medium|high\",\"msg\":\"\",\"snippet\":\"\"}],"
-        "\"improvements\":[],"
-        "\"tests_suggested\":[]"
-        "}\n"
-        f"IMPORTANT: You must provide numeric scores (0-10) for ALL of these criteria: {', '.join(selected_criteria)}.\n"
-        "Each score should reflect how well the reply addresses that specific criterion.\n"
-        "Use the full 0-10 range: 0-3=poor, 4-6=adequate, 7-8=good, 9-10=excellent.\n"
-        "Consider all criteria equally important unless the context suggests otherwise."
-    )
+    return _get_critic_system_cached(tuple(selected_criteria))
 
-# Legacy constant for backward compatibility (uses all criteria)
-CRITIC_SYSTEM = get_critic_system([
-    "correctness", "security", "performance", "clarity", "maintainability",
-    "logic", "error_handling", "testing", "scalability", "documentation", "design"
-])
+@functools.lru_cache(maxsize=64)
+def _get_critic_system_cached(selected_criteria: Tuple[str, ...]) -> str:
+    # Create dynamic scores schema based on selected criteria (duplicates collapse)
+    scores_keys = dict.fromkeys(_criterion_key(c) for c in selected_criteria)
+    scores = ",".join(f'"{k}":0-10' for k in scores_keys)
+    return _CRITIC_TEMPLATE.format_map({"scores": scores})
 
 def get_judge_system(selected_criteria: List[str]) -> str:
     """Generate dynamic JUDGE_SYSTEM prompt based on selected review criteria"""
+    return _get_judge_system_cached(tuple(selected_criteria))
+
+@functools.lru_cache(maxsize=64)
+def _get_judge_system_cached(selected_criteria: Tuple[str, ...]) -> str:
     # Create dynamic scores schema based on selected criteria
-    scores_json = ",".join([f'"{criterion.replace(" ", "_").replace("-", "_").lower()}":0-10' 
-                           for criterion in selected_criteria])
-    
-    return (
-        "You are a staff engineer who merges two code reviews into one final, neutral report.\n"
-        "Return STRICT JSON ONLY with this schema:\n"
-        "{"
-        "\"summary\":\"\","
-        "\"grade\":\"approve|revise\","
-        "\"winner\":\"A|B|tie\","
-        "\"reason\":\"\","
-        f"\"scores\":{{{scores_json}}},"
-        "\"top_issues\":[{\"type\":\"bug|security|style|perf|design\",\"severity\":\"low|medium|high\",\"msg\":\"\",\"snippet\":\"\"}],"
-        "\"recommended_changes\":[],"
-        "\"tests_suggested\":[],"
-        "\"notes\":[]"
-        "}\n"
-        f"IMPORTANT: Provide balanced scores (0-10) for these criteria: {', '.join(selected_criteria)}.\n"
-        "Consider both reviews carefully and merge their insights into comprehensive scores.\n"
-        "The winner should be the review with better overall analysis, not just higher scores."
-    )
+    scores = ",".join(f'"{_criterion_key(c)}":0-10' for c in selected_criteria)
+    return _JUDGE_TEMPLATE.format_map({"scores": scores})
 
-# Legacy constant for backward compatibility
-JUDGE_SYSTEM = get_judge_system([
+# Legacy CRITIC_SYSTEM / JUDGE_SYSTEM constants (all criteria), built on first access
+_LEGACY_CRITERIA = [
     "correctness", "security", "performance", "clarity", "maintainability",
     "logic", "error_handling", "testing", "scalability", "documentation", "design"
-])
+]
+_LEGACY_PROMPTS = {"CRITIC_SYSTEM": get_critic_system, "JUDGE_SYSTEM": get_judge_system}
+
+def __getattr__(name: str) -> Any:
+    builder = _LEGACY_PROMPTS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder(_LEGACY_CRITERIA)
+    return value
 
 SOLUTION_SYSTEM = (
     "You are a senior engineer. Given the user's goal, context, and the two reviews (or a merged review), "
@@ -146,42 +213,264 @@ SOLUTION_SYSTEM = (
     "Return plain text (no JSON)."
 )
 
+# ────────────────────────────────────────────────────────────────────────
+# JSON helpers (orjson when installed, stdlib json otherwise)
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Fall through so stdlib json reports the error / handles edge encodings
+    return json.loads(data)
+
+# json.dumps options for text shown in the GUI or copied to the clipboard:
+# keep non-ASCII review text readable and never fail on odd values
+_DISPLAY_JSON = {"indent": 2, "ensure_ascii": False, "default": str}
+
+def _json_dumps_pretty(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
 # ────────────────────────────────────────────────────────────────────────
 # HTTP chat helpers
 
-def _chat_http(base_url: str, api_key: str, model: str, messages: List[Dict[str, str]], force_json: bool) -> str:
+# Shared session so reviewer/judge/solution calls reuse keep-alive connections
+# instead of paying a new TCP + TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    # Only retry failures where the completion wasn't generated (refused
+    # connections, 429/5xx); a read timeout may already have been billed
+    max_retries=Retry(
+        total=3,
+        connect=2,
+        read=0,
+        other=0,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    ),
+))
+
+# Optional HTTP/2 client: concurrent calls to the same provider (e.g. both
+# reviewers on OpenAI) are multiplexed over one connection
+_HTTP2_CLIENT = None
+if USE_HTTP2 and httpx is not None:
+    try:
+        _HTTP2_CLIENT = httpx.Client(
+            http2=True,
+            timeout=TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        )
+    except ImportError:
+        pass  # httpx installed without the h2 extra; keep using requests
+
+# Progress callbacks receive the number of newly streamed characters
+ProgressCallback = Callable[[int], None]
+
+_STREAM_PROGRESS_EVERY = 16  # Report every N content deltas
+
+class _StreamingUnsupported(Exception):
+    """The endpoint rejected "stream": true; the request can be sent again without it"""
+
+def _rejects_streaming(status: int, text: str) -> bool:
+    """Whether an error response says streaming is unsupported (vs. auth, rate limit, bad input)"""
+    return status in (400, 422) and "stream" in text.lower()
+
+def _read_stream(lines: Any, progress: ProgressCallback) -> str:
+    """Collect delta.content from an SSE chat completion stream
+
+    Endpoints that ignore "stream" send an ordinary completion instead;
+    that body is parsed as-is rather than requested (and billed) again.
+    """
+    parts: List[str] = []
+    pending = 0
+    seen_event = False
+    plain: List[str] = []  # Non-SSE lines, kept until the first event shows up
+    for line in lines:
+        if not line.startswith("data: "):
+            if not seen_event:
+                plain.append(line)
+            continue
+        seen_event = True
+        data = line[6:].strip()
+        if data == "[DONE]":
+            break
+        event = _json_loads(data)
+        if not isinstance(event, dict):
+            continue  # Not a chunk object (e.g. "data: []"); nothing to collect
+        choices = event.get("choices") or []
+        choice = choices[0] if isinstance(choices, list) and choices else None
+        delta = choice.get("delta") if isinstance(choice, dict) else None
+        delta = delta.get("content") if isinstance(delta, dict) else None
+        if delta:
+            parts.append(delta)
+            pending += len(delta)
+            if len(parts) % _STREAM_PROGRESS_EVERY == 0:
+                progress(pending)
+                pending = 0
+    if not seen_event:
+        content = _json_loads("\n".join(plain))["choices"][0]["message"]["content"]
+        progress(len(content))
+        return content
+    if pending:
+        progress(pending)
+    return "".join(parts)
+
+def _chat_stream(url: str, headers: Dict[str, str], payload: Dict[str, Any], progress: ProgressCallback) -> str:
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+    if _HTTP2_CLIENT is not None:
+        with _HTTP2_CLIENT.stream("POST", url, headers=headers, content=body) as r:
+            if r.is_error and _rejects_streaming(r.status_code, r.read().decode("utf-8", "replace")):
+                raise _StreamingUnsupported(r.status_code)
+            r.raise_for_status()
+            return _read_stream(r.iter_lines(), progress)
+    with _SESSION.post(url, headers=headers, data=body, timeout=TIMEOUT, stream=True) as r:
+        if not r.ok and _rejects_streaming(r.status_code, r.text):
+            raise _StreamingUnsupported(r.status_code)
+        r.raise_for_status()
+        r.encoding = "utf-8"  # SSE is always UTF-8; requests would otherwise yield bytes
+        return _read_stream(r.iter_lines(decode_unicode=True), progress)
+
+@functools.lru_cache(maxsize=8)
+def _auth_headers(api_key: str) -> Dict[str, str]:
+    """Request headers per API key, built once (requests/httpx copy them, never mutate)"""
+    return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+
+def _chat_http(base_url: str, api_key: str, model: str, messages: List[Dict[str, str]], force_json: bool,
+               prompt_cache_key: Optional[str] = None, progress: Optional[ProgressCallback] = None) -> str:
     url = f"{base_url}/v1/chat/completions"
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    headers = _auth_headers(api_key)
     payload: Dict[str, Any] = {"model": model, "messages": messages}
     if force_json:
         payload["response_format"] = {"type": "json_object"}
-    r = requests.post(url, headers=headers, data=json.dumps(payload), timeout=TIMEOUT)
+    if prompt_cache_key:
+        payload["prompt_cache_key"] = prompt_cache_key
+    if progress is not None:
+        try:
+            return _chat_stream(url, headers, {**payload, "stream": True}, progress)
+        except _StreamingUnsupported:
+            pass  # Retry as a plain request; other HTTP errors (401, 429, ...) propagate
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+    if _HTTP2_CLIENT is not None:
+        r = _HTTP2_CLIENT.post(url, headers=headers, content=body)
+    else:
+        r = _SESSION.post(url, headers=headers, data=body, timeout=TIMEOUT)
     r.raise_for_status()
-    return r.json()["choices"][0]["message"]["content"]
-
-def chat_openai(messages: List[Dict[str, str]], force_json: bool = True, model: Optional[str] = None) -> str:
-    return _chat_http(OPENAI_BASE, OPENAI_API_KEY, model or OPENAI_MODEL_DEFAULT, messages, force_json)
-
-def chat_deepseek(messages: List[Dict[str, str]], force_json: bool = True, model: Optional[str] = None) -> str:
+    return _json_loads(r.content)["choices"][0]["message"]["content"]
+
+def _prompt_cache_key(messages: List[Dict[str, str]]) -> Optional[str]:
+    """Routing hint so requests sharing a system prompt hit the same prompt cache"""
+    system = next((m["content"] for m in messages if m.get("role") == "system"), None)
+    if not system:
+        return None
+    return hashlib.blake2b(system.encode("utf-8"), digest_size=8).hexdigest()
+
+def chat_openai(messages: List[Dict[str, str]], force_json: bool = True, model: Optional[str] = None,
+                progress: Optional[ProgressCallback] = None) -> str:
+    # prompt_cache_key is only sent to the official endpoint; proxies may reject it
+    cache_key = _prompt_cache_key(messages) if OPENAI_BASE == "https://api.openai.com" else None
+    return _chat_http(OPENAI_BASE, OPENAI_API_KEY, model or OPENAI_MODEL_DEFAULT, messages, force_json,
+                      cache_key, progress)
+
+def chat_deepseek(messages: List[Dict[str, str]], force_json: bool = True, model: Optional[str] = None,
+                  progress: Optional[ProgressCallback] = None) -> str:
     try:
-        return _chat_http(DEEPSEEK_BASE, DEEPSEEK_API_KEY, model or DEEPSEEK_MODEL_DEFAULT, messages, force_json)
+        return _chat_http(DEEPSEEK_BASE, DEEPSEEK_API_KEY, model or DEEPSEEK_MODEL_DEFAULT, messages, force_json,
+                          progress=progress)
     except Exception:
         # Some models reject forced JSON occasionally; retry without it.
-        return _chat_http(DEEPSEEK_BASE, DEEPSEEK_API_KEY, model or DEEPSEEK_MODEL_DEFAULT, messages, False)
+        return _chat_http(DEEPSEEK_BASE, DEEPSEEK_API_KEY, model or DEEPSEEK_MODEL_DEFAULT, messages, False,
+                          progress=progress)
+
+# Exact-match response cache: re-running the same reply/goal/context (e.g. after
+# toggling a checkbox back) is answered from memory instead of the network
+_RESPONSE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RESPONSE_CACHE_MAX = 128
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+def set_response_cache_enabled(enabled: bool) -> None:
+    """Turn the chat response cache on or off (clears it when disabled)"""
+    global RESPONSE_CACHE_ENABLED
+    RESPONSE_CACHE_ENABLED = enabled
+    if not enabled:
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE.clear()
+
+def _response_cache_key(provider: str, model: Optional[str], force_json: bool,
+                        messages: List[Dict[str, str]]) -> str:
+    canonical = json.dumps([provider, model, force_json, messages], sort_keys=True)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+def _is_cacheable_reply(reply: str, force_json: bool) -> bool:
+    """Only keep replies worth replaying: non-empty, and valid JSON objects when JSON was requested"""
+    if not reply or not reply.strip():
+        return False
+    if not force_json:
+        return True
+    try:
+        return isinstance(_json_loads(reply), dict)
+    except ValueError:
+        return False
 
-def chat_provider(provider: str, messages: List[Dict[str, str]], force_json: bool, model: Optional[str]) -> str:
+def chat_provider(provider: str, messages: List[Dict[str, str]], force_json: bool, model: Optional[str],
+                  progress: Optional[ProgressCallback] = None) -> str:
     provider = (provider or "openai").lower()
+    key = None
+    if RESPONSE_CACHE_ENABLED:
+        key = _response_cache_key(provider, model, force_json, messages)
+        with _RESPONSE_CACHE_LOCK:
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                _RESPONSE_CACHE.move_to_end(key)
+                return cached
+
     if provider == "deepseek":
-        return chat_deepseek(messages, force_json, model)
-    return chat_openai(messages, force_json, model)
+        reply = chat_deepseek(messages, force_json, model, progress)
+    else:
+        reply = chat_openai(messages, force_json, model, progress)
+
+    if key is not None and _is_cacheable_reply(reply, force_json):
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = reply
+            if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+                _RESPONSE_CACHE.popitem(last=False)
+    return reply
+
+_WARM_ERRORS: Tuple[type, ...] = (requests.RequestException,) + (
+    (httpx.HTTPError,) if httpx is not None else ())
+
+def warm_connections() -> None:
+    """Open keep-alive connections to the configured providers ahead of the first evaluation.
+
+    Run off the UI thread at startup so the first review doesn't also pay
+    for DNS, TCP and TLS setup. Failures are ignored; the real call retries.
+    """
+    providers = (REVIEWER_A_PROVIDER, REVIEWER_B_PROVIDER, JUDGE_PROVIDER)
+    for base in {DEEPSEEK_BASE if p == "deepseek" else OPENAI_BASE for p in providers}:
+        try:
+            if _HTTP2_CLIENT is not None:
+                _HTTP2_CLIENT.head(base, timeout=5)
+            else:
+                _SESSION.head(base, timeout=5)
+        except _WARM_ERRORS:
+            pass
 
 # ────────────────────────────────────────────────────────────────────────
 # Utilities
 
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601, to the second (e.g. 2025-01-31T12:00:00+00:00)"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
 def safe_json(s: str) -> Dict[str, Any]:
     """Enhanced JSON parsing with better error handling for review data"""
     try:
-        parsed = json.loads(s)
+        parsed = _json_loads(s)
         # Ensure we have the basic structure even if some fields are missing
         if isinstance(parsed, dict):
             # Add default scores if missing
@@ -242,8 +531,7 @@ def generate_scoring_instructions(criteria: List[str]) -> str:
     if not criteria:
         return "Provide balanced scores considering general code quality factors."
     
-    normalized_criteria = [c.replace(" ", "_").replace("-", "_").lower() for c in criteria]
-    criteria_list = ", ".join([f'"{c}"' for c in normalized_criteria])
+    criteria_list = ", ".join([f'"{_criterion_key(c)}"' for c in criteria])
     
     return f"""
 SCORING REQUIREMENTS:
@@ -254,63 +542,41 @@ SCORING REQUIREMENTS:
 - Be consistent in your scoring methodology
 """
 
+_PROMPT_RULE = "=" * 60
+_PROMPT_HEADER = f"{_PROMPT_RULE}\nREVIEW ASSIGNMENT\n{_PROMPT_RULE}"
+_PROMPT_CONTENT_BANNER = f"{_PROMPT_RULE}\nCONTENT TO REVIEW\n{_PROMPT_RULE}"
+_PROMPT_INSTRUCTIONS = (
+    f"{_PROMPT_RULE}\nINSTRUCTIONS\n{_PROMPT_RULE}\n\n"
+    "Evaluate the above content according to the specified criteria.\n"
+    "Focus your analysis on the selected evaluation dimensions.\n"
+    "Provide specific, actionable feedback in your JSON response.\n"
+    "Return ONLY valid JSON - no additional text or explanations."
+)
+
+@functools.lru_cache(maxsize=64)
+def _criteria_block(checks: Tuple[str, ...]) -> str:
+    """Criteria descriptions + scoring instructions for a given selection"""
+    return f"{format_criteria_list(checks)}\n\n{generate_scoring_instructions(checks)}"
+
 def make_user_prompt(claude_reply: str, goal: str, context: str, checks: List[str]) -> str:
     """Enhanced user prompt with detailed criteria formatting and scoring guidance"""
-    criteria_formatted = format_criteria_list(checks)
-    scoring_instructions = generate_scoring_instructions(checks)
-    
-    # Build the prompt with clear sections
-    prompt_parts = [
-        "=" * 60,
-        "REVIEW ASSIGNMENT",
-        "=" * 60,
-    ]
-    
-    # Add goal section
-    if goal and goal.strip():
-        prompt_parts.extend([
-            "",
-            "🎯 PRIMARY GOAL:",
-            goal.strip(),
-        ])
+    goal_section = f"\n\n🎯 PRIMARY GOAL:\n{goal.strip()}" if goal and goal.strip() else ""
+    context_section = f"\n\n📋 CONTEXT & CONSTRAINTS:\n{context.strip()}" if context and context.strip() else ""
     
-    # Add context section
-    if context and context.strip():
-        prompt_parts.extend([
-            "",
-            "📋 CONTEXT & CONSTRAINTS:",
-            context.strip(),
-        ])
-    
-    # Add criteria section
-    prompt_parts.extend([
-        "",
-        "🔍 EVALUATION CRITERIA:",
-        criteria_formatted,
-        "",
-        scoring_instructions,
-    ])
-    
-    # Add the content to review
-    prompt_parts.extend([
-        "",
-        "=" * 60,
-        "CONTENT TO REVIEW",
-        "=" * 60,
-        "",
-        claude_reply,
-        "",
-        "=" * 60,
-        "INSTRUCTIONS",
-        "=" * 60,
-        "",
-        "Evaluate the above content according to the specified criteria.",
-        "Focus your analysis on the selected evaluation dimensions.",
-        "Provide specific, actionable feedback in your JSON response.",
-        "Return ONLY valid JSON - no additional text or explanations.",
-    ])
-    
-    return "\n".join(prompt_parts)
+    # Static banner + criteria come first so the prompt prefix stays identical
+    # across runs (provider-side prompt caching); per-run fields follow
+    return (
+        f"{_PROMPT_HEADER}\n\n"
+        f"🔍 EVALUATION CRITERIA:\n{_criteria_block(tuple(checks))}"
+        f"{goal_section}{context_section}\n\n"
+        f"{_PROMPT_CONTENT_BANNER}\n\n{claude_reply}\n\n"
+        f"{_PROMPT_INSTRUCTIONS}"
+    )
+
+def _mean_score(values) -> Optional[float]:
+    """Mean of the numeric entries in values, or None when there are none"""
+    numeric = [v for v in values if isinstance(v, (int, float))]
+    return math.fsum(numeric) / len(numeric) if numeric else None
 
 def calculate_average_score(review_data: Dict[str, Any], selected_criteria: Optional[List[str]] = None) -> float:
     """Calculate average score from review data, handling variable criteria"""
@@ -320,43 +586,90 @@ def calculate_average_score(review_data: Dict[str, Any], selected_criteria: Opti
     
     # If specific criteria are provided, only consider those
     if selected_criteria:
-        normalized_criteria = [c.replace(" ", "_").replace("-", "_").lower() for c in selected_criteria]
-        relevant_scores = []
-        for criterion in normalized_criteria:
-            if criterion in scores and isinstance(scores[criterion], (int, float)):
-                relevant_scores.append(float(scores[criterion]))
-        
-        if relevant_scores:
-            return sum(relevant_scores) / len(relevant_scores)
+        avg = _mean_score(scores.get(_criterion_key(c)) for c in selected_criteria)
+        if avg is not None:
+            return avg
     
     # Otherwise, use all numeric scores available
-    numeric_scores = []
-    for value in scores.values():
-        if isinstance(value, (int, float)):
-            numeric_scores.append(float(value))
-    
-    return sum(numeric_scores) / max(1, len(numeric_scores))
+    avg = _mean_score(scores.values())
+    return avg if avg is not None else 0.0
+
+def _submit(fn: Callable[..., Any], *args: Any) -> Future:
+    """Run fn(*args) on a daemon thread and return a Future for its result.
+
+    Daemon threads rather than a ThreadPoolExecutor: the interpreter joins
+    executor workers at exit, so closing the window mid-evaluation would
+    block until every in-flight API call returned.
+    """
+    future: Future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="mozart-llm", daemon=True).start()
+    return future
+
+def _submit_reviewers(critic_system: str, prompt: str,
+                      progress: Optional[ProgressCallback] = None) -> Tuple[Future, Future]:
+    messages = [{"role": "system", "content": critic_system},
+                {"role": "user", "content": prompt}]
+    a_future = _submit(chat_provider, REVIEWER_A_PROVIDER, messages, True, REVIEWER_A_MODEL, progress)
+    b_future = _submit(chat_provider, REVIEWER_B_PROVIDER, messages, True, REVIEWER_B_MODEL, progress)
+    return a_future, b_future
+
+def run_reviewers(critic_system: str, prompt: str,
+                  progress: Optional[ProgressCallback] = None) -> Tuple[str, str]:
+    """Query Reviewer A and Reviewer B concurrently (the two calls are independent)."""
+    a_future, b_future = _submit_reviewers(critic_system, prompt, progress)
+    return a_future.result(), b_future.result()
+
+def _winning_solution(goal: str, context: str, winner_data: Dict[str, Any],
+                      progress: Optional[ProgressCallback] = None) -> str:
+    """Ask the judge model for the improved answer based on the winning review"""
+    return chat_provider(
+        JUDGE_PROVIDER,
+        [
+            {"role": "system", "content": SOLUTION_SYSTEM},
+            {"role": "user", "content":
+                f"GOAL:\n{goal}\n\nCONTEXT:\n{context}\n\n"
+                f"WINNING REVIEW:\n{_json_dumps_pretty(winner_data)}\n\n"
+                "Produce the improved final answer/patch now."}
+        ],
+        False,
+        JUDGE_MODEL,
+        progress,
+    )
+
+def fast_evaluate(claude_reply: str, goal: str, context: str, checks: List[str],
+                  progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """Run 2 parallel reviewers, pick the winner by average score.
 
-def fast_evaluate(claude_reply: str, goal: str, context: str, checks: List[str]) -> Dict[str, Any]:
-    """Run 2 parallel reviewers, pick the winner by average score."""
+    If `progress` is given, responses are streamed and it is called with the
+    number of characters received as they arrive (from worker threads).
+    """
+    _validate_keys()
     # Generate dynamic system prompts based on selected criteria
     critic_system = get_critic_system(checks)
     prompt = make_user_prompt(claude_reply, goal, context, checks)
 
-    a_raw = chat_provider(
-        REVIEWER_A_PROVIDER,
-        [{"role": "system", "content": critic_system},
-         {"role": "user", "content": prompt}],
-        True,
-        REVIEWER_A_MODEL,
-    )
-    b_raw = chat_provider(
-        REVIEWER_B_PROVIDER,
-        [{"role": "system", "content": critic_system},
-         {"role": "user", "content": prompt}],
-        True,
-        REVIEWER_B_MODEL,
-    )
+    speculative: Optional[Tuple[str, Future]] = None
+    a_future, b_future = _submit_reviewers(critic_system, prompt, progress)
+    if SPECULATIVE_SOLUTION:
+        # Start the solution from whichever review lands first; it is kept
+        # only if that reviewer turns out to be the winner. A wrong guess
+        # costs one extra paid solution call: it is already running and
+        # can't be cancelled, so it finishes (and is discarded) on its own
+        # daemon thread
+        first = next(as_completed((a_future, b_future)))
+        if first.exception() is None:
+            side = "A" if first is a_future else "B"
+            speculative = (side, _submit(_winning_solution, goal, context, safe_json(first.result()), progress))
+    a_raw, b_raw = a_future.result(), b_future.result()
 
     a_data = safe_json(a_raw)
     b_data = safe_json(b_raw)
@@ -372,18 +685,10 @@ def fast_evaluate(claude_reply: str, goal: str, context: str, checks: List[str])
         winner_data = b_data
         winner = "B"
 
-    solution = chat_provider(
-        JUDGE_PROVIDER,
-        [
-            {"role": "system", "content": SOLUTION_SYSTEM},
-            {"role": "user", "content":
-                f"GOAL:\n{goal}\n\nCONTEXT:\n{context}\n\n"
-                f"WINNING REVIEW:\n{json.dumps(winner_data, indent=2)}\n\n"
-                "Produce the improved final answer/patch now."}
-        ],
-        False,
-        JUDGE_MODEL,
-    )
+    if speculative is not None and speculative[0] == winner:
+        solution = speculative[1].result()
+    else:
+        solution = _winning_solution(goal, context, winner_data, progress)
 
     return {
         "mode": "FAST",
@@ -399,27 +704,16 @@ def fast_evaluate(claude_reply: str, goal: str, context: str, checks: List[str])
         "b_avg_score": b_avg,
     }
 
-def full_evaluate(claude_reply: str, goal: str, context: str, checks: List[str]) -> Dict[str, Any]:
-    """Run 2 reviewers + judge + solution."""
+def full_evaluate(claude_reply: str, goal: str, context: str, checks: List[str],
+                  progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """Run 2 reviewers + judge + solution (see fast_evaluate for `progress`)."""
+    _validate_keys()
     # Generate dynamic system prompts based on selected criteria
     critic_system = get_critic_system(checks)
     judge_system = get_judge_system(checks)
     prompt = make_user_prompt(claude_reply, goal, context, checks)
 
-    a_raw = chat_provider(
-        REVIEWER_A_PROVIDER,
-        [{"role": "system", "content": critic_system},
-         {"role": "user", "content": prompt}],
-        True,
-        REVIEWER_A_MODEL,
-    )
-    b_raw = chat_provider(
-        REVIEWER_B_PROVIDER,
-        [{"role": "system", "content": critic_system},
-         {"role": "user", "content": prompt}],
-        True,
-        REVIEWER_B_MODEL,
-    )
+    a_raw, b_raw = run_reviewers(critic_system, prompt, progress)
 
     merged_raw = chat_provider(
         JUDGE_PROVIDER,
@@ -427,6 +721,7 @@ def full_evaluate(claude_reply: str, goal: str, context: str, checks: List[str])
          {"role": "user", "content": f"Review A:\n{a_raw}\n\nReview B:\n{b_raw}\n\nMerge into final JSON."}],
         True,
         JUDGE_MODEL,
+        progress,
     )
 
     solution = chat_provider(
@@ -440,6 +735,7 @@ def full_evaluate(claude_reply: str, goal: str, context: str, checks: List[str])
         ],
         False,
         JUDGE_MODEL,
+        progress,
     )
 
     a_data = safe_json(a_raw)
@@ -481,11 +777,90 @@ FULL_MODE_BG = "#1a3a4a"     # Blue background for Full Mode
 FULL_MODE_FG = "#60a5fa"     # Blue text for Full Mode
 FULL_MODE_LIGHT = "#93c5fd"  # Light blue for description
 
+# Widget options for the review-mode box, keyed by "fast mode on"
+_MODE_THEMES: Dict[bool, Dict[str, Any]] = {
+    True: {  # Fast Mode - Green colors
+        "frame": {"bg": FAST_MODE_BG},
+        "label": {"bg": FAST_MODE_BG, "fg": FAST_MODE_FG, "text": "⚡ Review Mode:"},
+        "checkbutton": {"bg": FAST_MODE_BG, "fg": FAST_MODE_FG, "selectcolor": GREEN_BTN,
+                        "activebackground": FAST_MODE_BG, "activeforeground": FAST_MODE_FG,
+                        "text": "🚀 Fast Mode (Default)"},
+        "desc": {"bg": FAST_MODE_BG, "fg": FAST_MODE_LIGHT, "text": "Two reviewers compete, winner by score"},
+        "status": "🟡 Ready (Fast Mode)",
+    },
+    False: {  # Full Mode - Blue colors
+        "frame": {"bg": FULL_MODE_BG},
+        "label": {"bg": FULL_MODE_BG, "fg": FULL_MODE_FG, "text": "🎭 Review Mode:"},
+        "checkbutton": {"bg": FULL_MODE_BG, "fg": FULL_MODE_FG, "selectcolor": "#1565c0",
+                        "activebackground": FULL_MODE_BG, "activeforeground": FULL_MODE_FG,
+                        "text": "🎭 Full Mode (Comprehensive)"},
+        "desc": {"bg": FULL_MODE_BG, "fg": FULL_MODE_LIGHT, "text": "A + B + Judge + Solution (comprehensive)"},
+        "status": "🟡 Ready (Full Mode)",
+    },
+}
+
+# ttk style options (dark theme with green buttons), applied once in _setup_styles
+_STYLE_SPEC: Dict[str, Dict[str, Any]] = {
+    "TFrame": {"background": DARK_BG},
+    "Card.TFrame": {"background": DARK_PANEL, "relief": "flat"},
+    "TLabel": {"background": DARK_BG, "foreground": FG},
+    "H.TLabel": {"background": DARK_BG, "foreground": HL, "font": ("Segoe UI", 11, "bold")},
+    "Card.TLabel": {"background": DARK_PANEL, "foreground": FG},
+    "TButton": {"background": DARK_PANEL, "foreground": FG},
+    # Green button styles for specific buttons
+    "Green.TButton": {"background": GREEN_BTN, "foreground": "white", "font": ("Segoe UI", 9, "bold")},
+    # Copy button style (smaller, secondary)
+    "Copy.TButton": {"background": "#404040", "foreground": "#d4d4d4", "font": ("Segoe UI", 8)},
+    "Green.Horizontal.TProgressbar": {"troughcolor": "#111", "background": ACCENT},
+    "Vertical.TScrollbar": {"background": DARK_PANEL, "troughcolor": DARK_BG, "bordercolor": DARK_BG,
+                            "arrowcolor": FG, "darkcolor": DARK_PANEL, "lightcolor": DARK_PANEL},
+}
+
+_STYLE_MAPS: Dict[str, Dict[str, List[Tuple[str, str]]]] = {
+    "TButton": {"background": [("active", "#333333")]},
+    "Green.TButton": {"background": [("active", GREEN_BTN_HOVER), ("pressed", "#1b5e20")]},
+    "Copy.TButton": {"background": [("active", "#505050")]},
+}
+
+# JSON results view: lines rendered up front, then per scroll-near-end
+_OUT_FIRST_LINES = 200
+_OUT_PAGE_LINES = 500
+
+# Winner banner text, keyed by the judge's "winner" value
+_WINNER_TEXT: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "A": lambda r: f"🥇 {r.get('a_name', 'Reviewer A')}",
+    "B": lambda r: f"🥇 {r.get('b_name', 'Reviewer B')}",
+    "tie": lambda r: "🤝 Tie",
+}
+
+# Grade label colour by minimum average score; anything lower is _GRADE_COLOR_POOR
+_GRADE_COLORS = (
+    (8, "#4ade80"),  # Green for excellent
+    (6, "#facc15"),  # Yellow for good
+    (4, "#fb923c"),  # Orange for adequate
+)
+_GRADE_COLOR_POOR = "#f87171"  # Red for poor
+
+# Report spelling of the issue severities/types in the critic schema
+_SEVERITY_TEXT = {s: s.upper() for s in ("low", "medium", "high", "unknown")}
+_ISSUE_TYPE_TEXT = {t: t.title() for t in ("bug", "security", "style", "perf", "design", "general")}
+
+def _issue_line(issue: Dict[str, Any]) -> str:
+    """Markdown bullet for one reviewer issue in the exported report"""
+    severity = issue.get('severity', 'unknown')
+    severity = _SEVERITY_TEXT.get(severity) or severity.upper()
+    issue_type = issue.get('type', 'general')
+    issue_type = _ISSUE_TYPE_TEXT.get(issue_type) or issue_type.title()
+    message = issue.get('msg', 'No details provided')
+    return f"- **{severity} - {issue_type}**: {message}\n"
+
 class TextWidgetWithContextMenu(tk.Text):
     """Enhanced Text widget with right-click context menu and selection support"""
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        # Called before Select All, for views that only insert part of their text
+        self.before_select_all: Optional[Callable[[], None]] = None
         self.setup_context_menu()
         self.setup_bindings()
     
@@ -494,10 +869,12 @@ class TextWidgetWithContextMenu(tk.Text):
         self.context_menu = tk.Menu(self, tearoff=0, bg=DARK_PANEL, fg=FG, 
                                    activebackground=HL, activeforeground="white")
         self.context_menu.add_command(label="📋 Copy", command=self.context_copy)
+        self._copy_index = self.context_menu.index("end")
         self.context_menu.add_command(label="📄 Paste", command=self.context_paste)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="🔍 Select All", command=self.context_select_all)
         self.context_menu.add_command(label="✂️ Cut", command=self.context_cut)
+        self._cut_index = self.context_menu.index("end")
         self.context_menu.add_separator()
         self.context_menu.add_command(label="🗑️ Clear All", command=self.context_clear)
     
@@ -524,15 +901,11 @@ class TextWidgetWithContextMenu(tk.Text):
     def show_context_menu(self, event):
         """Show context menu on right-click"""
         try:
-            # Update menu state based on selection
-            has_selection = bool(self.tag_ranges("sel"))
-            clipboard_data = self.selection_get(selection="CLIPBOARD") if self.selection_own_get(selection="CLIPBOARD") else ""
-            has_clipboard = bool(clipboard_data)
-            
-            # Enable/disable menu items
-            self.context_menu.entryconfig("📋 Copy", state="normal" if has_selection else "disabled")
-            self.context_menu.entryconfig("✂️ Cut", state="normal" if has_selection else "disabled")
-            self.context_menu.entryconfig("📄 Paste", state="normal" if has_clipboard else "normal")  # Always allow paste attempt
+            # Update menu state based on selection; Paste is always enabled and
+            # context_paste handles an empty clipboard, so no clipboard probe here
+            state = "normal" if self.tag_ranges("sel") else "disabled"
+            self.context_menu.entryconfig(self._copy_index, state=state)
+            self.context_menu.entryconfig(self._cut_index, state=state)
             
             self.context_menu.tk_popup(event.x_root, event.y_root)
         except tk.TclError:
@@ -577,6 +950,8 @@ class TextWidgetWithContextMenu(tk.Text):
     
     def context_select_all(self):
         """Select all text"""
+        if self.before_select_all is not None:
+            self.before_select_all()
         self.tag_add("sel", "1.0", "end")
         self.mark_set("insert", "1.0")
         self.see("insert")
@@ -639,12 +1014,35 @@ class ScrollableApp(tk.Tk):
         # Configure minimum window size
         self.minsize(800, 600)
 
-        self._q: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        # Worker -> UI messages; deque append/popleft are atomic, so no lock is needed
+        self._q: "deque[Tuple[str, Any]]" = deque()
+        # Set while a <<MozartResult>> event is on its way, so bursts post only one
+        self._pump_pending = False
         self._thread: Optional[threading.Thread] = None
         self.result_json: Dict[str, Any] = {}
+        self._result_timestamp = ""  # When result_json was produced; reused on re-render
+        self._streamed_chars = 0
+        self._pending_pb = 0
+        self._pb_flush_pending = False
+        self._score_pools: Dict[str, Dict[str, Any]] = {}
+        self._last_criteria_signature: Optional[frozenset] = None
+        self._status_reset_id: Optional[str] = None
+        # Pretty JSON of result_json sections, valid while _json_cache_owner is result_json
+        self._json_cache: Dict[str, str] = {}
+        self._json_cache_owner: Optional[Dict[str, Any]] = None
+        # JSON view contents; the Text widget renders them page by page
+        self._out_text = ""
+        self._out_stale = False  # _out_text not yet rendered; done once the view is on screen
+        self._out_lines: List[str] = []
+        self._out_rendered_upto = 0
+        self._out_extend_pending = False
+        # Solution last inserted by _handle_result; ignored once the user edits the widget
+        self._solution_cache: Optional[str] = None
 
         # Fast mode variable - DEFAULT TO TRUE (Fast Mode)
         self.fast_var = tk.BooleanVar(value=True)
+        # Append the unmodified result under "raw_data" in the JSON view (Save JSON always has it)
+        self.raw_json_var = tk.BooleanVar(value=False)
 
         # Configure ttk styles
         self._setup_styles()
@@ -655,43 +1053,20 @@ class ScrollableApp(tk.Tk):
         # Create all content in the scrollable frame
         self._create_content()
         
-        # Start the event pump
-        self.after(100, self._pump)
+        # Worker threads signal results with a virtual event instead of polling
+        self.bind("<<MozartResult>>", lambda e: self._pump())
         
         # Bind mouse wheel to canvas scrolling
         self._bind_mousewheel()
 
     def _setup_styles(self):
         """Configure ttk styles for dark theme with green buttons"""
-        style = ttk.Style()
-        style.theme_use("clam")
-        style.configure("TFrame", background=DARK_BG)
-        style.configure("Card.TFrame", background=DARK_PANEL, relief="flat")
-        style.configure("TLabel", background=DARK_BG, foreground=FG)
-        style.configure("H.TLabel", background=DARK_BG, foreground=HL, font=("Segoe UI", 11, "bold"))
-        style.configure("Card.TLabel", background=DARK_PANEL, foreground=FG)
-        style.configure("TButton", background=DARK_PANEL, foreground=FG)
-        style.map("TButton", background=[("active", "#333333")])
-        
-        # Green button styles for specific buttons
-        style.configure("Green.TButton", 
-                       background=GREEN_BTN, 
-                       foreground="white",
-                       font=("Segoe UI", 9, "bold"))
-        style.map("Green.TButton", 
-                 background=[("active", GREEN_BTN_HOVER), ("pressed", "#1b5e20")])
-        
-        # Copy button style (smaller, secondary)
-        style.configure("Copy.TButton", 
-                       background="#404040", 
-                       foreground="#d4d4d4",
-                       font=("Segoe UI", 8))
-        style.map("Copy.TButton", 
-                 background=[("active", "#505050")])
-        
-        style.configure("Green.Horizontal.TProgressbar", troughcolor="#111", background=ACCENT)
-        style.configure("Vertical.TScrollbar", background=DARK_PANEL, troughcolor=DARK_BG, 
-                       bordercolor=DARK_BG, arrowcolor=FG, darkcolor=DARK_PANEL, lightcolor=DARK_PANEL)
+        self.style = ttk.Style(self)
+        self.style.theme_use("clam")
+        for name, opts in _STYLE_SPEC.items():
+            self.style.configure(name, **opts)
+        for name, opts in _STYLE_MAPS.items():
+            self.style.map(name, **opts)
 
     def _create_scrollable_container(self):
         """Create the main scrollable canvas and frame"""
@@ -715,7 +1090,9 @@ class ScrollableApp(tk.Tk):
         # Create window in canvas
         self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         
-        # Configure canvas to update scrollable frame width
+        # Configure canvas to update scrollable frame width (debounced)
+        self._resize_after_id: Optional[str] = None
+        self._applied_width: Optional[int] = None
         self.canvas.bind("<Configure>", self._on_canvas_configure)
         
         # Pack canvas and scrollbar
@@ -723,12 +1100,27 @@ class ScrollableApp(tk.Tk):
         self.scrollbar.pack(side="right", fill="y")
         
         # Configure scrollbar
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
+
+    def _on_canvas_scroll(self, first: str, last: str):
+        """Scrollbar update for the main canvas; renders the JSON view once it scrolls into sight"""
+        self.scrollbar.set(first, last)
+        if self._out_stale:
+            self._render_out_if_visible()
 
     def _on_canvas_configure(self, event):
         """Handle canvas resize to update scrollable frame width"""
-        canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        # Coalesce drag-resize events so only the final width triggers a relayout
+        if self._resize_after_id:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(30, lambda w=event.width: self._apply_canvas_width(w))
+
+    def _apply_canvas_width(self, width: int):
+        """Resize the scrollable frame to the canvas width if it changed"""
+        self._resize_after_id = None
+        if width != self._applied_width:
+            self._applied_width = width
+            self.canvas.itemconfig(self.canvas_window, width=width)
 
     def _bind_mousewheel(self):
         """Bind mouse wheel scrolling to the canvas"""
@@ -834,7 +1226,6 @@ class ScrollableApp(tk.Tk):
         checks_scrollbar = ttk.Scrollbar(checks_container, orient="vertical", command=checks_canvas.yview)
         checks_frame = ttk.Frame(checks_canvas)
         
-        checks_frame.bind("<Configure>", lambda e: checks_canvas.configure(scrollregion=checks_canvas.bbox("all")))
         checks_canvas.create_window((0, 0), window=checks_frame, anchor="nw")
         checks_canvas.configure(yscrollcommand=checks_scrollbar.set)
         
@@ -844,11 +1235,18 @@ class ScrollableApp(tk.Tk):
         # Create checkboxes for review criteria (all default ON)
         default_on = set(CHECK_OPTIONS)
         self.chk_vars = {k: tk.BooleanVar(value=(k in default_on)) for k in CHECK_OPTIONS}
-        for k, var in self.chk_vars.items():
+        # Plain-Python mirror of the checkbox states, so reading the selection needs no Tcl calls
+        self._check_keys: List[str] = list(CHECK_OPTIONS)
+        self._check_mask: List[bool] = [k in default_on for k in CHECK_OPTIONS]
+        for i, (k, var) in enumerate(self.chk_vars.items()):
             cb = ttk.Checkbutton(checks_frame, text=k.title(), variable=var, 
-                               command=self._update_criteria_summary)
+                               command=functools.partial(self._toggle_check, i))
             cb.pack(anchor="w", pady=1)
 
+        # The criteria list is fixed, so size the scroll region once instead of on every <Configure>
+        checks_frame.update_idletasks()
+        checks_canvas.configure(scrollregion=checks_canvas.bbox("all"))
+
         # Active Criteria Summary - NEW VISUAL FEEDBACK
         criteria_summary_frame = ttk.Frame(right_frame)
         criteria_summary_frame.pack(fill="x", pady=(10, 0))
@@ -891,6 +1289,11 @@ class ScrollableApp(tk.Tk):
                                  font=("Segoe UI", 8))
         self.mode_desc.pack(anchor="w")
 
+        # Response cache toggle
+        self.cache_var = tk.BooleanVar(value=RESPONSE_CACHE_ENABLED)
+        ttk.Checkbutton(right_frame, text="♻️ Reuse cached responses", variable=self.cache_var,
+                        command=lambda: set_response_cache_enabled(self.cache_var.get())).pack(anchor="w", pady=(6, 0))
+
         # Control buttons and status - GREEN EVALUATE BUTTON
         control_frame = ttk.Frame(content_frame)
         control_frame.pack(fill="x", pady=(10, 10))
@@ -903,14 +1306,40 @@ class ScrollableApp(tk.Tk):
         
         status_frame = ttk.Frame(control_frame)
         status_frame.pack(side="right", fill="x", expand=True, padx=(20, 0))
-        self.status = ttk.Label(status_frame, text="🟡 Ready (Fast Mode Default)", style="TLabel")
+        # Status text goes through a StringVar: updates are a variable write, not a configure
+        self._status_var = tk.StringVar(value="🟡 Ready (Fast Mode Default)")
+        self.status = ttk.Label(status_frame, textvariable=self._status_var, style="TLabel")
         self.status.pack(side="left")
-        self.pb = ttk.Progressbar(status_frame, mode="determinate", 
-                                 style="Green.Horizontal.TProgressbar", maximum=100, value=0)
+        self._pb_var = tk.IntVar(value=0)
+        self.pb = ttk.Progressbar(status_frame, mode="determinate", variable=self._pb_var,
+                                 style="Green.Horizontal.TProgressbar", maximum=100)
         self.pb.pack(side="right", fill="x", expand=True, padx=(10, 0))
 
+        # Initialize mode colors and description
+        self._on_fast_mode_change()
+
+        # Result sections are built once the window is up (or on first use)
+        self._content_frame = content_frame
+        self._pending_sections: Dict[str, Callable[[], None]] = {}
+        self._lazy("scores", self._build_score_cards)
+        self._lazy("json", self._build_json_view)
+        self._lazy("solution", self._build_solution_view)
+        self.after_idle(self._ensure, "solution")
+
+    def _lazy(self, name: str, factory: Callable[[], None]):
+        """Register a section factory to run on first _ensure()"""
+        self._pending_sections[name] = factory
+
+    def _ensure(self, name: str):
+        """Build section `name` (and any section registered before it, to keep pack order)"""
+        while name in self._pending_sections:
+            section = next(iter(self._pending_sections))
+            self._pending_sections.pop(section)()
+
+    def _build_score_cards(self):
+        """Create the Reviewer A / Reviewer B / Judge score cards"""
         # Score cards section with copy buttons for each card
-        scores_frame = ttk.Frame(content_frame)
+        scores_frame = ttk.Frame(self._content_frame)
         scores_frame.pack(fill="x", pady=(10, 10))
         
         scores_title_frame = ttk.Frame(scores_frame)
@@ -921,67 +1350,117 @@ class ScrollableApp(tk.Tk):
         cards_container = ttk.Frame(scores_frame)
         cards_container.pack(fill="x", pady=(5, 0))
 
-        # Reviewer A card with copy button
-        card_a_frame = ttk.Frame(cards_container)
-        card_a_frame.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        
-        card_a_header = ttk.Frame(card_a_frame)
-        card_a_header.pack(fill="x")
-        ttk.Label(card_a_header, text=f"👨‍💻 Reviewer A: {REVIEWER_A_NAME}", style="H.TLabel", font=("Segoe UI", 10, "bold")).pack(side="left")
-        ttk.Button(card_a_header, text="📋", command=self._copy_reviewer_a, style="Copy.TButton").pack(side="right")
-        
-        self.card_a = ttk.LabelFrame(card_a_frame, text="", padding=10, style="Card.TFrame")
-        self.card_a.pack(fill="x")
+        # Reviewer A / Reviewer B / Winner cards, each with a copy button
+        self.card_a = self._make_card(cards_container, f"👨‍💻 Reviewer A: {REVIEWER_A_NAME}",
+                                      self._copy_reviewer_a, (0, 5))
         self._scores_a = self._make_score_block(self.card_a)  # Will be updated with criteria during evaluation
 
-        # Reviewer B card with copy button
-        card_b_frame = ttk.Frame(cards_container)
-        card_b_frame.pack(side="left", fill="x", expand=True, padx=(5, 5))
-        
-        card_b_header = ttk.Frame(card_b_frame)
-        card_b_header.pack(fill="x")
-        ttk.Label(card_b_header, text=f"👩‍💻 Reviewer B: {REVIEWER_B_NAME}", style="H.TLabel", font=("Segoe UI", 10, "bold")).pack(side="left")
-        ttk.Button(card_b_header, text="📋", command=self._copy_reviewer_b, style="Copy.TButton").pack(side="right")
-        
-        self.card_b = ttk.LabelFrame(card_b_frame, text="", padding=10, style="Card.TFrame")
-        self.card_b.pack(fill="x")
+        self.card_b = self._make_card(cards_container, f"👩‍💻 Reviewer B: {REVIEWER_B_NAME}",
+                                      self._copy_reviewer_b, (5, 5))
         self._scores_b = self._make_score_block(self.card_b)  # Will be updated with criteria during evaluation
 
-        # Winner card with copy button
-        card_w_frame = ttk.Frame(cards_container)
-        card_w_frame.pack(side="left", fill="x", expand=True, padx=(5, 0))
-        
-        card_w_header = ttk.Frame(card_w_frame)
-        card_w_header.pack(fill="x")
-        ttk.Label(card_w_header, text="🏆 Judge's Results", style="H.TLabel", font=("Segoe UI", 10, "bold")).pack(side="left")
-        ttk.Button(card_w_header, text="📋", command=self._copy_judge_results, style="Copy.TButton").pack(side="right")
-        
-        self.card_w = ttk.LabelFrame(card_w_frame, text="", padding=10, style="Card.TFrame")
-        self.card_w.pack(fill="x")
-        self.winner_label = ttk.Label(self.card_w, text="—", style="H.TLabel")
+        self.card_w = self._make_card(cards_container, "🏆 Judge's Results", self._copy_judge_results, (5, 0))
+        self._winner_var = tk.StringVar(value="—")
+        self.winner_label = ttk.Label(self.card_w, textvariable=self._winner_var, style="H.TLabel")
         self.winner_label.pack(anchor="w")
-        self.winner_reason = ttk.Label(self.card_w, text="", style="Card.TLabel", 
-                                      wraplength=280, justify="left")
-        self.winner_reason.pack(anchor="w", pady=(5, 0))
-
+        # Read-only Text rather than a wraplength Label: Text keeps its wrap points
+        # and only re-wraps when its width changes
+        self.winner_reason = tk.Text(self.card_w, height=3, width=40, wrap="word", relief="flat",
+                                     bg=DARK_PANEL, fg=FG, borderwidth=0, highlightthickness=0,
+                                     font=("Segoe UI", 9), cursor="arrow", state="disabled")
+        self.winner_reason.pack(anchor="w", fill="x", pady=(5, 0))
+
+    def _make_card(self, container: ttk.Frame, title: str, copy_command: Callable[[], None],
+                   padx: Tuple[int, int]) -> ttk.LabelFrame:
+        """Create a titled result card with a copy button; returns its content frame"""
+        card_frame = ttk.Frame(container)
+        card_frame.pack(side="left", fill="x", expand=True, padx=padx)
+        
+        header = ttk.Frame(card_frame)
+        header.pack(fill="x")
+        ttk.Label(header, text=title, style="H.TLabel", font=("Segoe UI", 10, "bold")).pack(side="left")
+        ttk.Button(header, text="📋", command=copy_command, style="Copy.TButton").pack(side="right")
+        
+        card = ttk.LabelFrame(card_frame, text="", padding=10, style="Card.TFrame")
+        card.pack(fill="x")
+        return card
+
+    def _build_json_view(self):
+        """Create the detailed results (JSON) viewer"""
         # Result JSON section with enhanced text widget
-        json_frame = ttk.Frame(content_frame)
+        json_frame = ttk.Frame(self._content_frame)
         json_frame.pack(fill="x", pady=(10, 10))
         
         json_header = ttk.Frame(json_frame)
         json_header.pack(fill="x")
         ttk.Label(json_header, text="📋 Detailed Results (JSON):", style="H.TLabel").pack(side="left")
         ttk.Button(json_header, text="📄 Copy JSON", command=self.copy_json, style="Copy.TButton").pack(side="right")
+        ttk.Checkbutton(json_header, text="Include raw data", variable=self.raw_json_var,
+                        command=self._on_raw_json_toggle).pack(side="right", padx=(0, 8))
         
         json_container = ttk.Frame(json_frame)
         json_container.pack(fill="x", pady=(5, 0))
         self.out = TextWidgetWithContextMenu(json_container, height=8, bg="#0f0f0f", fg=FG, insertbackground=FG, 
                           wrap="word", font=("Consolas", 9), selectbackground=HL, selectforeground="white")
         self.out.pack(side="left", fill="both", expand=True)
-        self._attach_scrollbar(self.out, json_container)
+        self._out_scrollbar = self._attach_scrollbar(self.out, json_container)
+        self.out.configure(yscrollcommand=self._on_out_scroll)
+        self.out.before_select_all = self._render_out_fully
+
+    def _set_out_text(self, text: str):
+        """Show text in the JSON view, rendering only the first page of lines up front"""
+        self._out_text = text
+        self._out_lines = text.splitlines(keepends=True)
+        self._out_rendered_upto = min(len(self._out_lines), _OUT_FIRST_LINES)
+        self.out.delete("1.0", "end")
+        self.out.insert("1.0", "".join(self._out_lines[:self._out_rendered_upto]))
 
+    def _show_out_text(self, text: str):
+        """Set the JSON view's text, deferring the Text insert until the view is on screen"""
+        self._out_text = text
+        self._out_stale = True
+        self.after_idle(self._render_out_if_visible)
+
+    def _render_out_if_visible(self):
+        if not self._out_stale or "json" in self._pending_sections:
+            return
+        top = self.out.winfo_rooty()
+        view_top = self.canvas.winfo_rooty()
+        if top < view_top + self.canvas.winfo_height() and top + self.out.winfo_height() > view_top:
+            self._out_stale = False
+            self._set_out_text(self._out_text)
+
+    def _on_raw_json_toggle(self):
+        """Re-render the JSON view with or without the raw result"""
+        if self.result_json:
+            pretty, _ = self._format_result(self.result_json, self._result_timestamp, self.raw_json_var.get())
+            self._show_out_text(pretty)
+
+    def _on_out_scroll(self, first: str, last: str):
+        """Scrollbar update for the JSON view; append more lines when near the end"""
+        self._out_scrollbar.set(first, last)
+        if float(last) >= 0.8 and self._out_rendered_upto < len(self._out_lines) and not self._out_extend_pending:
+            # Defer the insert: this runs from Tk's redisplay
+            self._out_extend_pending = True
+            self.after_idle(self._extend_out)
+
+    def _extend_out(self, count: int = _OUT_PAGE_LINES):
+        self._out_extend_pending = False
+        end = min(len(self._out_lines), self._out_rendered_upto + count)
+        self.out.insert("end-1c", "".join(self._out_lines[self._out_rendered_upto:end]))
+        self._out_rendered_upto = end
+
+    def _render_out_fully(self):
+        """Insert the rest of the JSON view so Select All / Copy get the whole document"""
+        if self._out_stale:
+            self._out_stale = False
+            self._set_out_text(self._out_text)
+        self._extend_out(len(self._out_lines))
+
+    def _build_solution_view(self):
+        """Create the AI-generated solution viewer"""
         # Solution section - GREEN COPY SOLUTION BUTTON with enhanced text widget
-        solution_frame = ttk.Frame(content_frame)
+        solution_frame = ttk.Frame(self._content_frame)
         solution_frame.pack(fill="x", pady=(10, 20))
         
         solution_header = ttk.Frame(solution_frame)
@@ -1000,47 +1479,14 @@ class ScrollableApp(tk.Tk):
         self.solution.pack(side="left", fill="both", expand=True)
         self._attach_scrollbar(self.solution, solution_container)
 
-        # Initialize mode colors and description
-        self._on_fast_mode_change()
-
     def _on_fast_mode_change(self):
         """Update mode colors and description when fast mode changes"""
-        if self.fast_var.get():
-            # Fast Mode - Green colors
-            self.fast_mode_frame.config(bg=FAST_MODE_BG)
-            self.fast_mode_label.config(bg=FAST_MODE_BG, fg=FAST_MODE_FG)
-            self.fast_checkbutton.config(
-                bg=FAST_MODE_BG, 
-                fg=FAST_MODE_FG,
-                selectcolor=GREEN_BTN,
-                activebackground=FAST_MODE_BG,
-                activeforeground=FAST_MODE_FG,
-                text="🚀 Fast Mode (Default)"
-            )
-            self.mode_desc.config(
-                bg=FAST_MODE_BG, 
-                fg=FAST_MODE_LIGHT,
-                text="Two reviewers compete, winner by score"
-            )
-            self.status.config(text="🟡 Ready (Fast Mode)")
-        else:
-            # Full Mode - Blue colors
-            self.fast_mode_frame.config(bg=FULL_MODE_BG)
-            self.fast_mode_label.config(bg=FULL_MODE_BG, fg=FULL_MODE_FG, text="🎭 Review Mode:")
-            self.fast_checkbutton.config(
-                bg=FULL_MODE_BG, 
-                fg=FULL_MODE_FG,
-                selectcolor="#1565c0",
-                activebackground=FULL_MODE_BG,
-                activeforeground=FULL_MODE_FG,
-                text="🎭 Full Mode (Comprehensive)"
-            )
-            self.mode_desc.config(
-                bg=FULL_MODE_BG, 
-                fg=FULL_MODE_LIGHT,
-                text="A + B + Judge + Solution (comprehensive)"
-            )
-            self.status.config(text="🟡 Ready (Full Mode)")
+        theme = _MODE_THEMES[bool(self.fast_var.get())]
+        self.fast_mode_frame.config(theme["frame"])
+        self.fast_mode_label.config(theme["label"])
+        self.fast_checkbutton.config(theme["checkbutton"])
+        self.mode_desc.config(theme["desc"])
+        self._status_var.set(theme["status"])
 
     # Copy functionality methods
     def _copy_to_clipboard(self, content: str, description: str):
@@ -1048,11 +1494,25 @@ class ScrollableApp(tk.Tk):
         if content.strip():
             self.clipboard_clear()
             self.clipboard_append(content)
-            self.status.config(text=f"📋 {description} copied to clipboard")
-            self.after(2000, lambda: self.status.config(text="🟢 Ready"))
+            self._status_var.set(f"📋 {description} copied to clipboard")
+            self._schedule_status_reset(2000)
         else:
             messagebox.showwarning("Nothing to Copy", f"No {description.lower()} available to copy")
 
+    def _schedule_status_reset(self, delay_ms: int, text: str = "🟢 Ready"):
+        """Reset the status label after delay_ms, replacing any reset already pending"""
+        self._cancel_status_reset()
+        self._status_reset_id = self.after(delay_ms, self._reset_status, text)
+
+    def _cancel_status_reset(self):
+        if self._status_reset_id is not None:
+            self.after_cancel(self._status_reset_id)
+            self._status_reset_id = None
+
+    def _reset_status(self, text: str):
+        self._status_reset_id = None
+        self._status_var.set(text)
+
     def _copy_goal(self):
         """Copy goal to clipboard"""
         goal = self.goal_var.get()
@@ -1068,10 +1528,20 @@ class ScrollableApp(tk.Tk):
         reply = self.reply.get("1.0", "end").strip()
         self._copy_to_clipboard(reply, "Claude Reply")
 
+    def _result_dump(self, key: str) -> str:
+        """Pretty JSON of result_json[key], memoized until the result changes"""
+        if self._json_cache_owner is not self.result_json:
+            self._json_cache = {}
+            self._json_cache_owner = self.result_json
+        dump = self._json_cache.get(key)
+        if dump is None:
+            dump = self._json_cache[key] = json.dumps(self.result_json.get(key, {}), **_DISPLAY_JSON)
+        return dump
+
     def _copy_reviewer_a(self):
         """Copy Reviewer A results to clipboard"""
         if self.result_json and "a_review" in self.result_json:
-            content = json.dumps(self.result_json["a_review"], indent=2)
+            content = self._result_dump("a_review")
             self._copy_to_clipboard(content, f"Reviewer A ({self.result_json.get('a_name', 'A')}) Results")
         else:
             messagebox.showwarning("Nothing to Copy", "No Reviewer A results available")
@@ -1079,7 +1549,7 @@ class ScrollableApp(tk.Tk):
     def _copy_reviewer_b(self):
         """Copy Reviewer B results to clipboard"""
         if self.result_json and "b_review" in self.result_json:
-            content = json.dumps(self.result_json["b_review"], indent=2)
+            content = self._result_dump("b_review")
             self._copy_to_clipboard(content, f"Reviewer B ({self.result_json.get('b_name', 'B')}) Results")
         else:
             messagebox.showwarning("Nothing to Copy", "No Reviewer B results available")
@@ -1087,7 +1557,7 @@ class ScrollableApp(tk.Tk):
     def _copy_judge_results(self):
         """Copy Judge/Final results to clipboard"""
         if self.result_json and "final" in self.result_json:
-            content = json.dumps(self.result_json["final"], indent=2)
+            content = self._result_dump("final")
             self._copy_to_clipboard(content, "Judge/Final Results")
         else:
             messagebox.showwarning("Nothing to Copy", "No Judge results available")
@@ -1098,69 +1568,88 @@ class ScrollableApp(tk.Tk):
             messagebox.showwarning("Nothing to Copy", "No evaluation results available")
             return
         
+        result = self.result_json
+        a_review = result.get('a_review', {})
+        b_review = result.get('b_review', {})
+        final = result.get('final', {})
+
         # Get selected criteria for better formatting
-        selected_criteria = self.result_json.get('selected_criteria', [])
+        selected_criteria = result.get('selected_criteria', [])
         criteria_text = ", ".join(selected_criteria) if selected_criteria else "All criteria"
         
-        # Create enhanced formatted summary
-        content = f"""# Mozart V10 Review Results Summary
+        # Create enhanced formatted summary (fragments joined once at the end)
+        parts = [f"""# Mozart V10 Review Results Summary
 
 ## Evaluation Details:
-- **Mode**: {self.result_json.get('mode', 'Unknown')}
+- **Mode**: {result.get('mode', 'Unknown')}
 - **Selected Criteria**: {criteria_text}
-- **Timestamp**: {self.result_json.get('timestamp', 'Not recorded')}
+- **Timestamp**: {result.get('timestamp', 'Not recorded')}
 
-## Reviewer A ({self.result_json.get('a_name', 'Unknown')}):
-**Average Score**: {self.result_json.get('a_avg_score', 'N/A')}/10
+## Reviewer A ({result.get('a_name', 'Unknown')}):
+**Average Score**: {result.get('a_avg_score', 'N/A')}/10
 
 ### Detailed Review:
-{json.dumps(self.result_json.get('a_review', {}), indent=2)}
+{self._result_dump('a_review')}
 
-## Reviewer B ({self.result_json.get('b_name', 'Unknown')}):
-**Average Score**: {self.result_json.get('b_avg_score', 'N/A')}/10
+## Reviewer B ({result.get('b_name', 'Unknown')}):
+**Average Score**: {result.get('b_avg_score', 'N/A')}/10
 
 ### Detailed Review:
-{json.dumps(self.result_json.get('b_review', {}), indent=2)}
+{self._result_dump('b_review')}
 
 ## Final/Judge Results:
-**Final Average Score**: {self.result_json.get('final_avg_score', 'N/A')}/10
+**Final Average Score**: {result.get('final_avg_score', 'N/A')}/10
 
 ### Judge Analysis:
-{json.dumps(self.result_json.get('final', {}), indent=2)}
+{self._result_dump('final')}
 
 ## Competition Results:
-**Winner**: {self.result_json.get('winner', 'Unknown')}
+**Winner**: {result.get('winner', 'Unknown')}
 
 ## Selected Review Criteria Analysis:
-"""
+"""]
         
         # Add detailed criteria breakdown if available
         if selected_criteria:
-            content += "\n### Criteria-Specific Scores:\n"
-            a_scores = self.result_json.get('a_review', {}).get('scores', {})
-            b_scores = self.result_json.get('b_review', {}).get('scores', {})
-            final_scores = self.result_json.get('final', {}).get('scores', {})
+            parts.append("\n### Criteria-Specific Scores:\n")
+            a_scores = a_review.get('scores', {})
+            b_scores = b_review.get('scores', {})
+            final_scores = final.get('scores', {})
             
             for criterion in selected_criteria:
-                normalized = criterion.replace(" ", "_").replace("-", "_").lower()
-                content += f"\n**{criterion.title()}:**\n"
-                content += f"- Reviewer A: {a_scores.get(normalized, 'N/A')}/10\n"
-                content += f"- Reviewer B: {b_scores.get(normalized, 'N/A')}/10\n"
-                content += f"- Final/Judge: {final_scores.get(normalized, 'N/A')}/10\n"
-        
+                key = _criterion_key(criterion)
+                parts.append(
+                    f"\n**{criterion.title()}:**\n"
+                    f"- Reviewer A: {a_scores.get(key, 'N/A')}/10\n"
+                    f"- Reviewer B: {b_scores.get(key, 'N/A')}/10\n"
+                    f"- Final/Judge: {final_scores.get(key, 'N/A')}/10\n"
+                )
+        
+        content = "".join(parts)
         self._copy_to_clipboard(content, "All Review Results")
 
+    def _toggle_check(self, index: int):
+        """Checkbox callback: sync the mirrored state and refresh the summary"""
+        self._check_mask[index] = self.chk_vars[self._check_keys[index]].get()
+        self._update_criteria_summary()
+
+    def _selected_checks(self) -> List[str]:
+        return [k for k, on in zip(self._check_keys, self._check_mask) if on]
+
     def _update_criteria_summary(self):
         """Update the visual criteria summary showing active criteria"""
         try:
-            # Get currently selected criteria
-            selected = [k for k, v in self.chk_vars.items() if v.get()]
+            # Get currently selected criteria; skip the rewrite if nothing changed
+            selected = self._selected_checks()
+            signature = frozenset(selected)
+            if signature == self._last_criteria_signature:
+                return
             
             # Create summary text
             if not selected:
                 summary_text = "⚠️ No criteria selected - evaluation will use general review"
                 text_color = "#fb923c"  # Orange warning
-            elif len(selected) == len(CHECK_OPTIONS):
+            elif signature == CHECK_OPTIONS_SET:
                 summary_text = f"✅ All {len(selected)} criteria selected for comprehensive review"
                 text_color = "#4ade80"  # Green success
             else:
@@ -1177,6 +1666,7 @@ class ScrollableApp(tk.Tk):
             self.criteria_summary.delete("1.0", "end")
             self.criteria_summary.insert("1.0", summary_text)
             self.criteria_summary.config(state="disabled")
+            self._last_criteria_signature = signature
             
         except AttributeError:
             # Criteria summary widget not yet created
@@ -1188,113 +1678,148 @@ class ScrollableApp(tk.Tk):
         sb = ttk.Scrollbar(parent, orient="vertical", command=text_widget.yview)
         text_widget.configure(yscrollcommand=sb.set)
         sb.pack(side="right", fill="y")
+        return sb
 
-    def _make_score_block(self, parent: ttk.LabelFrame, criteria: Optional[List[str]] = None) -> Dict[str, ttk.Label]:
-        """Create a dynamic score display block based on selected criteria"""
-        # Handle None parent for testing
-        if parent is None:
-            return {}
-            
-        # Clear any existing content
-        for widget in parent.winfo_children():
-            widget.destroy()
-            
+    def _score_pool(self, parent: ttk.LabelFrame) -> Dict[str, Any]:
+        """Create the score rows for a card once; evaluations only re-lay them out"""
+        pool = self._score_pools.get(str(parent))
+        if pool is not None:
+            return pool
         grid = ttk.Frame(parent, style="Card.TFrame")
         grid.pack(fill="x", pady=5)
         labels: Dict[str, ttk.Label] = {}
-        
+        values: Dict[str, tk.StringVar] = {}
+        rows = {"grade": self._add_score_row(grid, "grade", "📊", "Grade", labels, values)}
+        for criterion in CHECK_OPTIONS:
+            rows[criterion] = self._add_score_row(grid, criterion, _CRITERIA_EMOJIS[criterion],
+                                                  criterion.title(), labels, values)
+        rows["total"] = self._add_score_row(grid, "total", "🎯", "Average", labels, values)
+        pool = {
+            "rows": rows,
+            "labels": labels,
+            "values": values,
+            "sep_unselected": ttk.Separator(grid, orient="horizontal"),
+            "more": ttk.Label(grid, text="", style="Card.TLabel", font=("Segoe UI", 8), foreground="#888888"),
+            "sep_total": ttk.Separator(grid, orient="horizontal"),
+            "layout": None,  # Criteria tuple the rows are currently gridded for
+        }
+        self._score_pools[str(parent)] = pool
+        return pool
+
+    def _make_score_block(self, parent: ttk.LabelFrame, criteria: Optional[List[str]] = None) -> Dict[str, tk.StringVar]:
+        """Lay out the score display block for the selected criteria (rows are pooled per card)"""
+        # Handle None parent for testing
+        if parent is None:
+            return {}
+
+        pool = self._score_pool(parent)
+        layout = tuple(criteria or ())
+        if pool["layout"] == layout:
+            # Same selection as last time: rows are already in place, and every
+            # value but the grade colour is rewritten by _update_score_card
+            pool["labels"]["grade"].config(foreground="")
+            return pool["values"]
+        pool["layout"] = layout
+        rows = pool["rows"]
+        for row_frame, _, _, _ in rows.values():
+            row_frame.grid_remove()
+        for key in ("sep_unselected", "more", "sep_total"):
+            pool[key].grid_remove()
+
         # Always show grade first
-        self._add_score_row(grid, 0, "grade", "📊", "Grade", "—", labels, is_selected=True)
+        self._show_score_row(rows["grade"], 0, is_selected=True)
         row = 1
         
         # If no criteria specified, show all available criteria
         if not criteria:
             criteria = CHECK_OPTIONS
-            
-        # Add score rows for all criteria (both selected and unselected)
-        all_criteria_emojis = {
-            "correctness": "✅", "security": "🔒", "performance": "⚡", 
-            "clarity": "📖", "maintainability": "🔧", "logic": "🧠",
-            "error handling": "🛡️", "testing": "🧪", "scalability": "📈",
-            "documentation": "📝", "design": "🎨"
-        }
         
         # Show selected criteria first (highlighted)
         for criterion in criteria:
-            if criterion in all_criteria_emojis:
-                emoji = all_criteria_emojis[criterion]
-                self._add_score_row(grid, row, criterion, emoji, criterion.title(), "—", labels, is_selected=True)
+            if criterion in _CRITERIA_EMOJIS:
+                self._show_score_row(rows[criterion], row, is_selected=True)
                 row += 1
         
         # Add separator for unselected criteria if we have selected ones
         if criteria and len(criteria) < len(CHECK_OPTIONS):
-            separator = ttk.Separator(grid, orient="horizontal")
-            separator.grid(row=row, column=0, columnspan=3, sticky="ew", pady=3)
+            pool["sep_unselected"].grid(row=row, column=0, columnspan=3, sticky="ew", pady=3)
             row += 1
             
             # Show unselected criteria (dimmed)
-            unselected = [c for c in CHECK_OPTIONS if c not in criteria]
+            criteria_set = set(criteria)
+            unselected = [c for c in CHECK_OPTIONS if c not in criteria_set]
             for criterion in unselected[:3]:  # Limit to prevent overcrowding
-                if criterion in all_criteria_emojis:
-                    emoji = all_criteria_emojis[criterion]
-                    self._add_score_row(grid, row, criterion, emoji, criterion.title(), "—", labels, is_selected=False)
-                    row += 1
+                self._show_score_row(rows[criterion], row, is_selected=False)
+                row += 1
             
             if len(unselected) > 3:
                 # Add "more..." indicator
-                more_label = ttk.Label(grid, text="... +{} more criteria available".format(len(unselected) - 3), 
-                                     style="Card.TLabel", font=("Segoe UI", 8), foreground="#888888")
-                more_label.grid(row=row, column=0, columnspan=3, sticky="w", pady=2)
+                pool["more"].config(text="... +{} more criteria available".format(len(unselected) - 3))
+                pool["more"].grid(row=row, column=0, columnspan=3, sticky="w", pady=2)
                 row += 1
         
         # Always show total at the end
-        separator = ttk.Separator(grid, orient="horizontal")
-        separator.grid(row=row, column=0, columnspan=3, sticky="ew", pady=3)
+        pool["sep_total"].grid(row=row, column=0, columnspan=3, sticky="ew", pady=3)
         row += 1
-        self._add_score_row(grid, row, "total", "🎯", "Average", "—", labels, is_selected=True)
+        self._show_score_row(rows["total"], row, is_selected=True)
         
-        return labels
+        return pool["values"]
     
-    def _add_score_row(self, parent: ttk.Frame, row: int, key: str, emoji: str, label: str, 
-                      default_value: str, labels: Dict[str, ttk.Label], is_selected: bool = True):
-        """Add a single score row to the grid"""
-        # Create emoji label
-        emoji_label = ttk.Label(parent, text=emoji, style="Card.TLabel")
-        emoji_label.grid(row=row, column=0, sticky="w", padx=(0, 5), pady=1)
-        
-        # Create text label with conditional styling
-        if is_selected:
-            text_label = ttk.Label(parent, text=f"{label}:", style="Card.TLabel", 
-                                 font=("Segoe UI", 9))
-        else:
-            text_label = ttk.Label(parent, text=f"{label}:", style="Card.TLabel", 
-                                 font=("Segoe UI", 9), foreground="#666666")
-        text_label.grid(row=row, column=1, sticky="w", padx=(0, 10), pady=1)
+    def _add_score_row(self, parent: ttk.Frame, key: str, emoji: str, label: str,
+                      labels: Dict[str, ttk.Label], values: Dict[str, tk.StringVar]
+                      ) -> Tuple[ttk.Frame, ttk.Label, ttk.Label, tk.StringVar]:
+        """Create one score row: a frame with emoji/text/value labels packed left to right.
+
+        The row is placed with a single grid call by _show_score_row. The text
+        label has a fixed width (longest criterion) so the values stay aligned.
+        The value label shows a StringVar, so updating a score is one set().
+        """
+        row_frame = ttk.Frame(parent, style="Card.TFrame")
+        ttk.Label(row_frame, text=emoji, style="Card.TLabel").pack(side="left", padx=(0, 5))
+        text_label = ttk.Label(row_frame, text=f"{label}:", style="Card.TLabel", font=("Segoe UI", 9),
+                               width=_SCORE_LABEL_WIDTH)
+        text_label.pack(side="left", padx=(0, 10))
+        value_var = tk.StringVar(self, value="—")
+        value_label = ttk.Label(row_frame, textvariable=value_var, style="Card.TLabel",
+                                font=("Consolas", 9, "bold"))
+        value_label.pack(side="left")
+        
+        # Store references for updates
+        labels[key] = value_label
+        values[key] = value_var
+        return row_frame, text_label, value_label, value_var
+
+    def _show_score_row(self, row_widgets: Tuple[ttk.Frame, ttk.Label, ttk.Label, tk.StringVar], row: int,
+                        is_selected: bool = True):
+        """Grid a pooled score row and reset it to its selected/dimmed look"""
+        row_frame, text_label, value_label, value_var = row_widgets
         
-        # Create value label
+        # Text label with conditional styling ("" falls back to the style colour)
+        text_label.config(foreground="" if is_selected else "#666666")
+        value_var.set("—")
         if is_selected:
-            value_label = ttk.Label(parent, text=default_value, style="Card.TLabel", 
-                                  font=("Consolas", 9, "bold"))
+            value_label.config(font=("Consolas", 9, "bold"), foreground="")
         else:
-            value_label = ttk.Label(parent, text="—", style="Card.TLabel", 
-                                  font=("Consolas", 9), foreground="#888888")
-        value_label.grid(row=row, column=2, sticky="w", pady=1)
-        
-        # Store reference for updates
-        labels[key] = value_label
+            value_label.config(font=("Consolas", 9), foreground="#888888")
+        row_frame.grid(row=row, column=0, columnspan=3, sticky="ew", pady=1)
 
     # Event handlers and business logic methods
     def _paste(self):
         """Paste clipboard content to the reply text widget"""
         try:
             clipboard_content = self.clipboard_get()
-            self.reply.delete("1.0", "end")
-            self.reply.insert("1.0", clipboard_content)
-        except:
+        except tk.TclError:
             messagebox.showwarning("Paste Error", "Could not paste from clipboard")
+            return
+        if not clipboard_content:
+            return
+        if self.reply.index("end-1c") != "1.0":  # Skip the delete when already empty
+            self.reply.delete("1.0", "end")
+        self.reply.insert("1.0", clipboard_content)
 
     def _load_file(self):
         """Load a file into the reply text widget"""
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             title="Select file to review",
             filetypes=[
@@ -1307,14 +1832,27 @@ class ScrollableApp(tk.Tk):
         )
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.reply.delete("1.0", "end")
-                self.reply.insert("1.0", content)
+                self._stream_insert(self.reply, file_path)
                 self.goal_var.set(f"Review the code in {Path(file_path).name}")
             except Exception as e:
+                self.reply.delete("1.0", "end")
                 messagebox.showerror("File Error", f"Could not load file: {e}")
 
+    def _stream_insert(self, widget: tk.Text, path: str, chunk_size: int = 1 << 20):
+        """Replace widget's text with a UTF-8 file, inserted chunk by chunk so large files keep the UI painting"""
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+        widget.delete("1.0", "end")
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            while True:
+                chunk = os.read(fd, chunk_size)
+                widget.insert("end", decoder.decode(chunk, final=not chunk))
+                if not chunk:
+                    break
+                self.update_idletasks()
+        finally:
+            os.close(fd)
+
     def on_evaluate(self):
         """Start the evaluation process with enhanced feedback"""
         if self._thread and self._thread.is_alive():
@@ -1329,8 +1867,9 @@ class ScrollableApp(tk.Tk):
             messagebox.showwarning("Missing Input", "Please provide Claude's reply to evaluate")
             return
 
-        checks = [k for k, v in self.chk_vars.items() if v.get()]
+        checks = self._selected_checks()
         fast_mode = self.fast_var.get()
+        include_raw = self.raw_json_var.get()
 
         # Enhanced status feedback with criteria count
         mode_text = "FAST" if fast_mode else "FULL"
@@ -1342,24 +1881,32 @@ class ScrollableApp(tk.Tk):
         else:
             criteria_text = f"{criteria_count} criteria"
             
-        self.status.config(text=f"🔄 Evaluating ({mode_text} Mode, {criteria_text})...")
-        self.pb.config(value=10)
+        self._cancel_status_reset()  # Don't let an earlier "Ready" overwrite this
+        self._status_var.set(f"🔄 Evaluating ({mode_text} Mode, {criteria_text})...")
+        self._set_progress(10)
         
         # Update criteria summary to show evaluation in progress
         self.criteria_summary.config(state="normal", fg="#facc15")
         self.criteria_summary.delete("1.0", "end")
         self.criteria_summary.insert("1.0", f"⚡ Evaluating with {criteria_text}...")
         self.criteria_summary.config(state="disabled")
+        self._last_criteria_signature = None  # Summary text no longer reflects the selection
         
+        self._streamed_chars = 0
+
+        def progress(chars: int):
+            self._post(("progress", chars))
+
         def worker():
             try:
                 if fast_mode:
-                    result = fast_evaluate(claude_reply, goal, context, checks)
+                    result = fast_evaluate(claude_reply, goal, context, checks, progress)
                 else:
-                    result = full_evaluate(claude_reply, goal, context, checks)
-                self._q.put(("result", result))
+                    result = full_evaluate(claude_reply, goal, context, checks, progress)
+                timestamp = _utc_timestamp()
+                self._post(("result", (result, timestamp, *self._format_result(result, timestamp, include_raw))))
             except Exception as e:
-                self._q.put(("error", str(e)))
+                self._post(("error", str(e)))
 
         self._thread = threading.Thread(target=worker, daemon=True)
         self._thread.start()
@@ -1370,6 +1917,7 @@ class ScrollableApp(tk.Tk):
             messagebox.showwarning("No Data", "No evaluation results to save")
             return
             
+        from tkinter import filedialog
         file_path = filedialog.asksaveasfilename(
             title="Save JSON Results",
             defaultextension=".json",
@@ -1389,6 +1937,7 @@ class ScrollableApp(tk.Tk):
             messagebox.showwarning("No Data", "No evaluation results to export")
             return
             
+        from tkinter import filedialog
         file_path = filedialog.asksaveasfilename(
             title="Export Report",
             defaultextension=".md",
@@ -1396,9 +1945,17 @@ class ScrollableApp(tk.Tk):
         )
         if file_path:
             try:
+                # Build the whole report first and swap it into place, so a failure
+                # never leaves a truncated file behind
                 report = self._generate_report()
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(report)
+                tmp_path = f"{file_path}.tmp"
+                try:
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        f.write(report)
+                    os.replace(tmp_path, file_path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
                 messagebox.showinfo("Exported", f"Report exported to {file_path}")
             except Exception as e:
                 messagebox.showerror("Export Error", f"Could not export report: {e}")
@@ -1411,195 +1968,189 @@ class ScrollableApp(tk.Tk):
         result = self.result_json
         selected_criteria = result.get('selected_criteria', [])
         criteria_text = ", ".join(selected_criteria) if selected_criteria else "General review"
+        criteria_keys = [(c, _criterion_key(c)) for c in selected_criteria]
         
-        report = f"""# {AGENT_NAME} V10 Code Review Report
+        buf = io.StringIO()
+        buf.write(f"""# {AGENT_NAME} V10 Code Review Report
 
 ## Executive Summary
 - **Evaluation Mode**: {result.get('mode', 'Unknown')}
 - **Review Criteria**: {criteria_text} ({len(selected_criteria)} criteria)
 - **Overall Winner**: {result.get('winner', 'Unknown')}
 - **Final Grade**: {result.get('final', {}).get('grade', 'N/A')}
-- **Report Generated**: {threading.current_thread().name}
+- **Report Generated**: {_utc_timestamp()}
 
 ## Evaluation Criteria Analysis
-"""
+""")
         
         # Add criteria-specific breakdown
         if selected_criteria:
-            report += f"### Selected Criteria ({len(selected_criteria)} of {len(CHECK_OPTIONS)} available):\n"
-            for criterion in selected_criteria:
-                # Get criterion description
-                descriptions = {
-                    "correctness": "Code accuracy, logic soundness, and correct implementation",
-                    "security": "Vulnerability assessment, secure coding practices, data protection",
-                    "performance": "Efficiency, speed optimization, resource usage, scalability",
-                    "clarity": "Code readability, naming conventions, structure organization",
-                    "maintainability": "Future-proofing, modularity, ease of modification",
-                    "logic": "Reasoning flow, algorithm design, decision-making processes",
-                    "error handling": "Exception management, edge cases, fault tolerance",
-                    "testing": "Test coverage, testability, quality assurance approaches",
-                    "scalability": "Growth handling, load management, architectural flexibility",
-                    "documentation": "Code comments, API docs, usage examples, explanations",
-                    "design": "Architecture patterns, design principles, structural quality"
-                }
-                desc = descriptions.get(criterion.lower(), "General assessment")
-                report += f"- **{criterion.title()}**: {desc}\n"
-        
-        # Comparative scoring table
-        report += f"\n## Comparative Scoring\n\n| Criterion | Reviewer A | Reviewer B | Final/Judge |\n|-----------|------------|------------|-------------|\n"
-        
-        a_scores = result.get('a_review', {}).get('scores', {})
-        b_scores = result.get('b_review', {}).get('scores', {})
-        final_scores = result.get('final', {}).get('scores', {})
-        
-        # Add score rows for selected criteria
-        for criterion in selected_criteria:
-            normalized = criterion.replace(" ", "_").replace("-", "_").lower()
-            a_score = a_scores.get(normalized, "—")
-            b_score = b_scores.get(normalized, "—")
-            final_score = final_scores.get(normalized, "—")
-            report += f"| {criterion.title()} | {a_score}/10 | {b_score}/10 | {final_score}/10 |\n"
-        
-        # Add average scores
-        report += f"| **Average** | **{result.get('a_avg_score', 'N/A')}/10** | **{result.get('b_avg_score', 'N/A')}/10** | **{result.get('final_avg_score', 'N/A')}/10** |\n"
-
-        report += f"""
+            buf.write(f"### Selected Criteria ({len(selected_criteria)} of {len(CHECK_OPTIONS)} available):\n")
+            buf.writelines(
+                f"- **{c.title()}**: {_DESCRIPTIONS_BY_KEY.get(k, 'General assessment')}\n"
+                for c, k in criteria_keys
+            )
+        
+        a_review = result.get('a_review', {})
+        b_review = result.get('b_review', {})
+        final_review = result.get('final', {})
+        a_scores = a_review.get('scores', {})
+        b_scores = b_review.get('scores', {})
+        final_scores = final_review.get('scores', {})
+        
+        # Comparative scoring table (skipped when no reviewer returned scores)
+        if a_scores or b_scores or final_scores:
+            buf.write(f"\n## Comparative Scoring\n\n| Criterion | Reviewer A | Reviewer B | Final/Judge |\n|-----------|------------|------------|-------------|\n")
+            
+            # Add score rows for selected criteria
+            buf.writelines(
+                f"| {c.title()} | {a_scores.get(k, '—')}/10 | {b_scores.get(k, '—')}/10 | {final_scores.get(k, '—')}/10 |\n"
+                for c, k in criteria_keys
+            )
+            
+            # Add average scores
+            buf.write(f"| **Average** | **{result.get('a_avg_score', 'N/A')}/10** | **{result.get('b_avg_score', 'N/A')}/10** | **{result.get('final_avg_score', 'N/A')}/10** |\n")
+
+        if a_review:
+            buf.write(f"""
 
 ## Reviewer A: {result.get('a_name', 'Unknown')}
 **Provider**: {REVIEWER_A_PROVIDER.title()} ({REVIEWER_A_MODEL})  
 **Average Score**: {result.get('a_avg_score', 'N/A')}/10
-"""
-        
-        a_review = result.get('a_review', {})
-        if 'summary' in a_review:
-            report += f"\n### Analysis Summary\n{a_review['summary']}\n"
+""")
             
-        if 'issues' in a_review and a_review['issues']:
-            report += "\n### Key Issues Identified\n"
-            for issue in a_review['issues'][:5]:  # Limit to top 5
-                severity = issue.get('severity', 'unknown').upper()
-                issue_type = issue.get('type', 'general').title()
-                message = issue.get('msg', 'No details provided')
-                report += f"- **{severity} - {issue_type}**: {message}\n"
+            if 'summary' in a_review:
+                buf.write(f"\n### Analysis Summary\n{a_review['summary']}\n")
+                
+            a_issues = a_review.get('issues')
+            if a_issues:
+                buf.write("\n### Key Issues Identified\n")
+                buf.writelines(map(_issue_line, itertools.islice(a_issues, 5)))  # Limit to top 5
             
-        report += f"""
+        if b_review:
+            buf.write(f"""
 
 ## Reviewer B: {result.get('b_name', 'Unknown')}
 **Provider**: {REVIEWER_B_PROVIDER.title()} ({REVIEWER_B_MODEL})  
 **Average Score**: {result.get('b_avg_score', 'N/A')}/10
-"""
-        
-        b_review = result.get('b_review', {})
-        if 'summary' in b_review:
-            report += f"\n### Analysis Summary\n{b_review['summary']}\n"
+""")
             
-        if 'issues' in b_review and b_review['issues']:
-            report += "\n### Key Issues Identified\n"
-            for issue in b_review['issues'][:5]:  # Limit to top 5
-                severity = issue.get('severity', 'unknown').upper()
-                issue_type = issue.get('type', 'general').title()
-                message = issue.get('msg', 'No details provided')
-                report += f"- **{severity} - {issue_type}**: {message}\n"
+            if 'summary' in b_review:
+                buf.write(f"\n### Analysis Summary\n{b_review['summary']}\n")
+                
+            b_issues = b_review.get('issues')
+            if b_issues:
+                buf.write("\n### Key Issues Identified\n")
+                buf.writelines(map(_issue_line, itertools.islice(b_issues, 5)))  # Limit to top 5
         
         # Final judgment section
-        final_review = result.get('final', {})
         if final_review:
-            report += f"\n## Final Judgment\n**Average Score**: {result.get('final_avg_score', 'N/A')}/10\n"
+            buf.write(f"\n## Final Judgment\n**Average Score**: {result.get('final_avg_score', 'N/A')}/10\n")
             
             if 'summary' in final_review:
-                report += f"\n### Judge's Assessment\n{final_review['summary']}\n"
+                buf.write(f"\n### Judge's Assessment\n{final_review['summary']}\n")
                 
             if 'winner' in final_review and 'reason' in final_review:
-                report += f"\n### Winner Determination\n**Winner**: {final_review['winner']}\n**Reasoning**: {final_review['reason']}\n"
+                buf.write(f"\n### Winner Determination\n**Winner**: {final_review['winner']}\n**Reasoning**: {final_review['reason']}\n")
             
-            if 'recommended_changes' in final_review and final_review['recommended_changes']:
-                report += "\n### Recommended Changes\n"
-                for change in final_review['recommended_changes'][:5]:
-                    report += f"- {change}\n"
+            changes = final_review.get('recommended_changes')
+            if changes:
+                buf.write("\n### Recommended Changes\n")
+                buf.writelines(f"- {change}\n" for change in itertools.islice(changes, 5))
         
         # Solution section
         if 'solution' in result and result['solution'].strip():
-            report += f"\n## AI-Generated Solution\n\n```\n{result['solution']}\n```\n"
+            buf.write(f"\n## AI-Generated Solution\n\n```\n{result['solution']}\n```\n")
         
-        report += f"\n---\n*Generated by Mozart V10 Dynamic Review System*"
+        buf.write(f"\n---\n*Generated by Mozart V10 Dynamic Review System*")
         
-        return report
+        return buf.getvalue()
 
     def copy_json(self):
         """Copy JSON results to clipboard"""
-        json_content = self.out.get("1.0", "end").strip()
+        self._ensure("json")
+        # Read the full text, not the widget (which may only hold the first pages)
+        json_content = self._out_text.strip()
         self._copy_to_clipboard(json_content, "JSON Results")
 
+    def _solution_content(self) -> str:
+        """Solution text, read back from the widget only if the user edited it"""
+        self._ensure("solution")
+        if self._solution_cache is not None and not self.solution.edit_modified():
+            return self._solution_cache
+        return self.solution.get("1.0", "end").strip()
+
     def copy_solution(self):
         """Copy solution to clipboard"""
-        solution_content = self.solution.get("1.0", "end").strip()
+        solution_content = self._solution_content()
         self._copy_to_clipboard(solution_content, "Solution")
 
     def submit_to_claude(self):
         """Open Claude.ai with the solution"""
-        solution_content = self.solution.get("1.0", "end").strip()
+        solution_content = self._solution_content()
         if solution_content:
             # Copy to clipboard first
             self.clipboard_clear()
             self.clipboard_append(solution_content)
             # Open Claude.ai
+            import webbrowser
             webbrowser.open("https://claude.ai/")
-            self.status.config(text="🚀 Solution copied and Claude.ai opened")
-            self.after(3000, lambda: self.status.config(text="🟢 Ready"))
+            self._status_var.set("🚀 Solution copied and Claude.ai opened")
+            self._schedule_status_reset(3000)
         else:
             messagebox.showwarning("No Solution", "No solution available to submit")
 
-    def _pump(self):
-        """Process queue messages"""
+    def _set_progress(self, value: int):
+        """Set the progress bar; bursts of updates collapse into one idle-time write"""
+        self._pending_pb = value
+        if not self._pb_flush_pending:
+            self._pb_flush_pending = True
+            self.after_idle(self._flush_progress)
+
+    def _flush_progress(self):
+        self._pb_flush_pending = False
+        self._pb_var.set(self._pending_pb)
+
+    def _post(self, msg: Tuple[str, Any]):
+        """Queue a message from a worker thread and wake the UI if it isn't already due to drain"""
+        self._q.append(msg)
+        if self._pump_pending:
+            return
+        self._pump_pending = True
         try:
-            while True:
-                msg_type, data = self._q.get_nowait()
-                if msg_type == "result":
-                    self._handle_result(data)
-                elif msg_type == "error":
-                    self._handle_error(data)
-        except queue.Empty:
-            pass
-        finally:
-            self.after(100, self._pump)
+            self.event_generate("<<MozartResult>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window closed or main loop exiting while the evaluation was running;
+            # clear the flag so a later post can still schedule a pump
+            self._pump_pending = False
 
-    def _handle_result(self, result: Dict[str, Any]):
-        """Handle successful evaluation result"""
-        self.result_json = result
-        self.pb.config(value=100)
-        mode_text = "FAST" if self.fast_var.get() else "FULL"
-        self.status.config(text=f"✅ Evaluation complete ({mode_text})")
-        
-        # Get selected criteria from result
-        selected_criteria = result.get("selected_criteria", [])
-        
-        # Recreate score blocks with the selected criteria for better visual representation
-        self._scores_a = self._make_score_block(self.card_a, selected_criteria)
-        self._scores_b = self._make_score_block(self.card_b, selected_criteria)
-        
-        # Update score cards with the new criteria-aware system
-        self._update_score_card(self._scores_a, result.get("a_review", {}), selected_criteria)
-        self._update_score_card(self._scores_b, result.get("b_review", {}), selected_criteria)
-        
-        # Update winner information
-        final_data = result.get("final", {})
-        winner = final_data.get("winner", result.get("winner", "Unknown"))
-        reason = final_data.get("reason", "")
-        
-        winner_text = f"Winner: {winner}"
-        if winner == "A":
-            winner_text = f"🥇 {result.get('a_name', 'Reviewer A')}"
-        elif winner == "B":
-            winner_text = f"🥇 {result.get('b_name', 'Reviewer B')}"
-        elif winner == "tie":
-            winner_text = "🤝 Tie"
-            
-        self.winner_label.config(text=winner_text)
-        self.winner_reason.config(text=reason)
-        
-        # Update JSON output with enhanced formatting
-        self.out.delete("1.0", "end")
-        
+    def _pump(self):
+        """Drain queued worker messages (runs on <<MozartResult>>)"""
+        # Clear before draining: anything posted from here on either gets drained
+        # below or raises a fresh event
+        self._pump_pending = False
+        while self._q:
+            msg_type, data = self._q.popleft()
+            if msg_type == "progress":
+                # Streamed output moves the bar from 10% towards 95% (~100 chars per step)
+                self._streamed_chars += data
+                self._set_progress(min(95, 10 + self._streamed_chars // 100))
+            elif msg_type == "result":
+                self._handle_result(*data)
+            elif msg_type == "error":
+                self._handle_error(data)
+
+    @staticmethod
+    def _format_result(result: Dict[str, Any], timestamp: str,
+                       include_raw: bool = False) -> Tuple[str, Dict[str, str]]:
+        """Serialize a result for display (runs on the worker thread).
+
+        Returns the pretty JSON shown in the results view plus the per-review
+        dumps used by the copy buttons. The summary already carries every
+        section of the result, so the full result is only repeated under
+        "raw_data" when include_raw is set. `timestamp` is recorded once per
+        result, so re-rendering it keeps the same time.
+        """
         # Create enhanced JSON output with criteria summary
         enhanced_output = {
             "mozart_v10_results": {
@@ -1607,7 +2158,7 @@ class ScrollableApp(tk.Tk):
                     "mode": result.get("mode", "Unknown"),
                     "selected_criteria": result.get("selected_criteria", []),
                     "criteria_count": len(result.get("selected_criteria", [])),
-                    "timestamp": threading.current_thread().name,
+                    "timestamp": timestamp,
                     "winner": result.get("winner", "Unknown")
                 },
                 "reviewer_a": {
@@ -1628,107 +2179,122 @@ class ScrollableApp(tk.Tk):
                     "avg_score": result.get("final_avg_score", "N/A"),
                     "detailed_analysis": result.get("final", {})
                 },
-                "solution": result.get("solution", "No solution provided"),
-                "raw_data": result  # Keep original for compatibility
+                "solution": result.get("solution", "No solution provided")
             }
         }
+        if include_raw:
+            enhanced_output["mozart_v10_results"]["raw_data"] = result
         
-        self.out.insert("1.0", json.dumps(enhanced_output, indent=2))
+        dumps = {key: json.dumps(result[key], **_DISPLAY_JSON)
+                 for key in ("a_review", "b_review", "final") if key in result}
+        return json.dumps(enhanced_output, **_DISPLAY_JSON), dumps
+
+    def _handle_result(self, result: Dict[str, Any], timestamp: str, pretty: str, dumps: Dict[str, str]):
+        """Handle successful evaluation result"""
+        self._ensure("solution")
+        self.result_json = result
+        self._result_timestamp = timestamp
+        self._json_cache = dumps
+        self._json_cache_owner = result
+        self._set_progress(100)
+        mode_text = "FAST" if self.fast_var.get() else "FULL"
+        self._status_var.set(f"✅ Evaluation complete ({mode_text})")
+        
+        # Get selected criteria from result
+        selected_criteria = result.get("selected_criteria", [])
+        
+        # Recreate score blocks with the selected criteria for better visual representation
+        self._scores_a = self._make_score_block(self.card_a, selected_criteria)
+        self._scores_b = self._make_score_block(self.card_b, selected_criteria)
+        
+        # Update score cards with the new criteria-aware system
+        self._update_score_card(self.card_a, result.get("a_review", {}), selected_criteria)
+        self._update_score_card(self.card_b, result.get("b_review", {}), selected_criteria)
+        
+        # Update winner information
+        final_data = result.get("final", {})
+        winner = final_data.get("winner", result.get("winner", "Unknown"))
+        reason = final_data.get("reason", "")
+        
+        winner_fmt = _WINNER_TEXT.get(winner) if isinstance(winner, str) else None
+        winner_text = winner_fmt(result) if winner_fmt else f"Winner: {winner}"
+            
+        self._winner_var.set(winner_text)
+        self.winner_reason.config(state="normal")
+        self.winner_reason.delete("1.0", "end")
+        self.winner_reason.insert("1.0", reason)
+        self.winner_reason.config(state="disabled")
+        
+        # Update JSON output (pre-formatted by the worker thread; inserted once visible)
+        self._show_out_text(pretty)
         
         # Update solution
+        solution = result.get("solution", "No solution provided")
         self.solution.delete("1.0", "end")
-        self.solution.insert("1.0", result.get("solution", "No solution provided"))
+        self.solution.insert("1.0", solution)
+        self.solution.edit_modified(False)
+        self._solution_cache = solution.strip()
         
         # Restore criteria summary after evaluation
         self._update_criteria_summary()
         
         # Reset progress bar after a delay
-        self.after(2000, lambda: self.pb.config(value=0))
-        self.after(2000, lambda: self.status.config(text="🟢 Ready"))
+        self.after(2000, self._set_progress, 0)
+        self._schedule_status_reset(2000)
 
     def _handle_error(self, error_msg: str):
         """Handle evaluation error"""
-        self.pb.config(value=0)
-        self.status.config(text="❌ Error occurred")
+        self._set_progress(0)
+        self._status_var.set("❌ Error occurred")
         messagebox.showerror("Evaluation Error", f"Error during evaluation:\n{error_msg}")
         
         # Restore criteria summary after error
         self._update_criteria_summary()
         
-        self.after(2000, lambda: self.status.config(text="🟡 Ready"))
+        self._schedule_status_reset(2000, "🟡 Ready")
 
-    def _update_score_card(self, score_labels: Dict[str, ttk.Label], review_data: Dict[str, Any], 
+    def _update_score_card(self, card: ttk.LabelFrame, review_data: Dict[str, Any], 
                           selected_criteria: Optional[List[str]] = None):
         """Update a score card with review data based on dynamic criteria"""
+        pool = self._score_pool(card)
+        score_vars: Dict[str, tk.StringVar] = pool["values"]
         scores = review_data.get("scores", {})
         grade = review_data.get("grade", "—")
         
         # Update grade
-        if "grade" in score_labels:
-            grade_text = grade.upper() if grade and grade != "—" else "—"
-            score_labels["grade"].config(text=grade_text)
-        
-        # Normalize criteria names for score lookup
-        def normalize_criterion(name: str) -> str:
-            return name.replace(" ", "_").replace("-", "_").lower()
-        
-        # Update scores for selected criteria
-        total_score = 0
-        score_count = 0
+        score_vars["grade"].set(grade.upper() if grade and grade != "—" else "—")
         
+        # Update scores for selected criteria (fallback: every criterion row)
         if selected_criteria:
-            for criterion in selected_criteria:
-                normalized = normalize_criterion(criterion)
-                
-                if criterion in score_labels:  # Label exists
-                    if normalized in scores and isinstance(scores[normalized], (int, float)):
-                        score_value = scores[normalized]
-                        score_labels[criterion].config(text=f"{score_value}/10")
-                        total_score += float(score_value)
-                        score_count += 1
-                    else:
-                        score_labels[criterion].config(text="—")
+            rows = [(c, score_vars[c]) for c in selected_criteria if c in score_vars]
         else:
-            # Fallback: use all available scores
-            for key, label in score_labels.items():
-                if key in ["grade", "total"]:
-                    continue
-                
-                normalized = normalize_criterion(key)
-                if normalized in scores and isinstance(scores[normalized], (int, float)):
-                    score_value = scores[normalized]
-                    label.config(text=f"{score_value}/10")
-                    total_score += float(score_value)
-                    score_count += 1
-                else:
-                    label.config(text="—")
+            rows = [(k, var) for k, var in score_vars.items() if k not in ("grade", "total")]
+        
+        values = []
+        for criterion, var in rows:
+            score_value = scores.get(_criterion_key(criterion))
+            if isinstance(score_value, (int, float)):
+                var.set(f"{score_value}/10")
+                values.append(score_value)
+            else:
+                var.set("—")
+        avg_score = _mean_score(values)
         
         # Update total average
-        if "total" in score_labels:
-            if score_count > 0:
-                avg_score = total_score / score_count
-                score_labels["total"].config(text=f"{avg_score:.1f}/10")
-            else:
-                score_labels["total"].config(text="—")
+        score_vars["total"].set(f"{avg_score:.1f}/10" if avg_score is not None else "—")
         
         # Update visual feedback for score quality
-        if "grade" in score_labels and score_count > 0:
-            avg_score = total_score / score_count
-            if avg_score >= 8:
-                grade_color = "#4ade80"  # Green for excellent
-            elif avg_score >= 6:
-                grade_color = "#facc15"  # Yellow for good
-            elif avg_score >= 4:
-                grade_color = "#fb923c"  # Orange for adequate
-            else:
-                grade_color = "#f87171"  # Red for poor
-                
+        if avg_score is not None:
+            grade_color = next((c for t, c in _GRADE_COLORS if avg_score >= t), _GRADE_COLOR_POOR)
             # Apply color to the grade label
-            score_labels["grade"].config(foreground=grade_color)
+            pool["labels"]["grade"].config(foreground=grade_color)
 
 
 def main():
     """Main entry point"""
+    _validate_keys()
+    if WARM_CONNECTIONS:
+        threading.Thread(target=warm_connections, name="mozart-warm", daemon=True).start()
     try:
         app = ScrollableApp()
         app.mainloop()
@@ -5,13 +5,19 @@ Mozart Dueling AI Setup Script
 Automatically sets up the environment and configures API keys through a GUI.
 """
 
+import functools
 import os
+import re
 import sys
-import subprocess
-import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+import threading
+from collections import deque
+from importlib.util import find_spec
+from types import MappingProxyType
 from pathlib import Path
-import json
+
+# tkinter is imported by _import_tk() when the GUI starts, so the version
+# check in main() (and importing this module) doesn't pay for loading Tk
+tk = ttk = messagebox = None
 
 # Constants
 PROJECT_ROOT = Path(__file__).parent
@@ -19,16 +25,84 @@ ENV_FILE = PROJECT_ROOT / ".env.mozart"
 ENV_EXAMPLE_FILE = PROJECT_ROOT / ".env.mozart.example"
 REQUIREMENTS_FILE = PROJECT_ROOT / "requirements.txt"
 
+# Modules the app needs at runtime -> the pip package that provides each
+_REQUIRED_MODULES = {
+    'requests': 'requests',
+    'tkinter': 'tkinter',
+    'dotenv': 'python-dotenv',
+}
+
+# pip output lines that mark one more package resolved, and the final install step
+_PIP_PACKAGE_LINE = re.compile(r"(?:Collecting|Requirement already satisfied:) ")
+_PIP_INSTALLING_LINE = "Installing collected packages"
+
+# Template placeholders that mean "no key configured yet"
+_KEY_PLACEHOLDERS = {
+    'OPENAI_API_KEY': 'your_openai_api_key_here',
+    'DEEPSEEK_API_KEY': 'your_deepseek_api_key_here',
+}
+
+_PLACEHOLDER_RE = re.compile("|".join(map(re.escape, _KEY_PLACEHOLDERS.values())))
+
+def fill_placeholders(content, keys):
+    """Replace each key's template placeholder with keys[name] in a single pass"""
+    subs = {_KEY_PLACEHOLDERS[name]: value for name, value in keys.items()}
+    return _PLACEHOLDER_RE.sub(lambda m: subs.get(m.group(0), m.group(0)), content)
+
+# One KEY=VALUE setting; comments and blank lines don't match
+_ENV_LINE = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$')
+
+@functools.lru_cache(maxsize=8)
+def _parse_env(path_str, mtime_ns, size):
+    """Parse KEY=VALUE lines of an env file; cached per (path, mtime, size) so edits are picked up"""
+    text = Path(path_str).read_text(encoding='utf-8')
+    matches = map(_ENV_LINE.match, text.splitlines())
+    return MappingProxyType({m.group(1): m.group(2) for m in matches if m})
+
+def load_env_file(path):
+    """Read-only mapping of the settings in an env file (parsed once per file version)"""
+    st = path.stat()
+    return _parse_env(str(path), st.st_mtime_ns, st.st_size)
+
+def write_if_changed(path, content):
+    """Write text to path (UTF-8, platform newlines) unless it already holds exactly that; True if written"""
+    new = content.replace('\n', os.linesep).encode('utf-8')
+    try:
+        if path.read_bytes() == new:
+            return False
+    except OSError:
+        pass  # Missing or unreadable; write it
+    path.write_bytes(new)
+    return True
+
+def count_requirements(path):
+    """Number of requirement lines (non-blank, non-comment) in a requirements file"""
+    try:
+        lines = path.read_text(encoding='utf-8').splitlines()
+        return sum(1 for line in lines if line.strip() and not line.lstrip().startswith('#'))
+    except OSError:
+        return 0
+
+def _import_tk():
+    """Bind tk, ttk and messagebox at module level on first use"""
+    global tk, ttk, messagebox
+    if tk is None:
+        import tkinter as tk
+        from tkinter import ttk, messagebox
+
+# Smallest initial window size (width, height); grows to fit the widgets if needed
+_MIN_SIZE = (600, 500)
+
 class SetupGUI:
     def __init__(self):
+        _import_tk()
         self.root = tk.Tk()
+        self.root.withdraw()  # Stay hidden while the widgets are built, then lay out once
+        # Screen size doesn't change while setup runs; ask the window system once
+        self._screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
         self.root.title("Mozart Dueling AI - Setup")
-        self.root.geometry("600x500")
         self.root.resizable(True, True)
         
-        # Center the window
-        self.center_window()
-        
         # API key variables
         self.openai_key = tk.StringVar()
         self.deepseek_key = tk.StringVar()
@@ -36,16 +110,27 @@ class SetupGUI:
         # Setup completed flag
         self.setup_completed = False
         
+        # Worker -> UI messages, drained on <<SetupMessage>> (deque ops are thread-safe)
+        self._q = deque()
+        self._pump_pending = False
+        self._installing = False
+        self.root.bind("<<SetupMessage>>", lambda e: self._pump())
+        
         self.create_widgets()
         self.check_existing_config()
         
+        # Center the window
+        self.center_window()
+        self.root.deiconify()
+        
     def center_window(self):
-        """Center the window on screen"""
+        """Center the window on screen, sized to its contents (at least _MIN_SIZE)"""
         self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        width = max(self.root.winfo_reqwidth(), _MIN_SIZE[0])
+        height = max(self.root.winfo_reqheight(), _MIN_SIZE[1])
+        screen_width, screen_height = self._screen_size
+        x = (screen_width // 2) - (width // 2)
+        y = (screen_height // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
     
     def create_widgets(self):
@@ -80,21 +165,18 @@ class SetupGUI:
         api_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 20))
         api_frame.columnconfigure(1, weight=1)
         
-        # OpenAI API Key
-        ttk.Label(api_frame, text="OpenAI API Key:").grid(row=0, column=0, sticky="w", pady=5)
-        openai_entry = ttk.Entry(api_frame, textvariable=self.openai_key, show="*", width=50)
-        openai_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
+        # OpenAI / DeepSeek API keys (masked; one "Show keys" toggle reveals both)
+        self.show_keys = tk.BooleanVar(value=False)
+        self._key_entries = []
+        key_rows = (("OpenAI API Key:", self.openai_key), ("DeepSeek API Key:", self.deepseek_key))
+        for row, (label, var) in enumerate(key_rows):
+            ttk.Label(api_frame, text=label).grid(row=row, column=0, sticky="w", pady=5)
+            entry = ttk.Entry(api_frame, textvariable=var, show="*", width=50)
+            entry.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
+            self._key_entries.append(entry)
         
-        ttk.Button(api_frame, text="Show", 
-                  command=lambda: self.toggle_password(openai_entry)).grid(row=0, column=2, padx=(5, 0))
-        
-        # DeepSeek API Key
-        ttk.Label(api_frame, text="DeepSeek API Key:").grid(row=1, column=0, sticky="w", pady=5)
-        deepseek_entry = ttk.Entry(api_frame, textvariable=self.deepseek_key, show="*", width=50)
-        deepseek_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
-        
-        ttk.Button(api_frame, text="Show", 
-                  command=lambda: self.toggle_password(deepseek_entry)).grid(row=1, column=2, padx=(5, 0))
+        ttk.Checkbutton(api_frame, text="Show keys", variable=self.show_keys,
+                        command=self._apply_show_keys).grid(row=0, column=2, rowspan=len(key_rows), padx=(5, 0))
         
         # Help text
         help_text = ("• OpenAI API Key: Get from https://platform.openai.com/api-keys\n"
@@ -129,30 +211,27 @@ class SetupGUI:
         ttk.Button(button_frame, text="Exit", 
                   command=self.root.quit).pack(side="right")
     
-    def toggle_password(self, entry_widget):
-        """Toggle password visibility"""
-        if entry_widget['show'] == '*':
-            entry_widget.config(show='')
-        else:
-            entry_widget.config(show='*')
+    def _apply_show_keys(self):
+        """Mask or reveal every API key entry to match the Show checkbox"""
+        show = '' if self.show_keys.get() else '*'
+        for entry in self._key_entries:
+            entry.config(show=show)
+    
+    def _key_vars(self):
+        """Entry variable for each API key setting, keyed like _KEY_PLACEHOLDERS"""
+        return {'OPENAI_API_KEY': self.openai_key, 'DEEPSEEK_API_KEY': self.deepseek_key}
     
     def check_existing_config(self):
         """Check if configuration already exists"""
         if ENV_FILE.exists():
             try:
-                with open(ENV_FILE, 'r') as f:
-                    content = f.read()
-                    
-                # Extract existing keys
-                for line in content.split('\n'):
-                    if line.startswith('OPENAI_API_KEY=') and not line.endswith('your_openai_api_key_here'):
-                        key = line.split('=', 1)[1].strip()
-                        if key and key != 'your_openai_api_key_here':
-                            self.openai_key.set('*' * 20)  # Show asterisks for existing key
-                    elif line.startswith('DEEPSEEK_API_KEY=') and not line.endswith('your_deepseek_api_key_here'):
-                        key = line.split('=', 1)[1].strip()
-                        if key and key != 'your_deepseek_api_key_here':
-                            self.deepseek_key.set('*' * 20)  # Show asterisks for existing key
+                env = load_env_file(ENV_FILE)
+                
+                # Show asterisks for keys that are already configured
+                for name, var in self._key_vars().items():
+                    key = env.get(name)
+                    if key and key != _KEY_PLACEHOLDERS[name]:
+                        var.set('*' * 20)
                 
                 if self.openai_key.get() or self.deepseek_key.get():
                     self.progress_var.set("Existing configuration found. You can update API keys if needed.")
@@ -166,48 +245,129 @@ class SetupGUI:
         self.progress_bar['value'] = 20
         self.root.update()
         
-        try:
-            # Check if required packages are available
-            import requests
-            import tkinter
-            from dotenv import load_dotenv
-            
+        # Look the packages up without importing (and so executing) them
+        missing = [pkg for module, pkg in _REQUIRED_MODULES.items() if find_spec(module) is None]
+        if not missing:
             self.progress_var.set("All dependencies are installed!")
             self.progress_bar['value'] = 100
             messagebox.showinfo("Dependencies", "All required dependencies are installed!")
-            
-        except ImportError as e:
+        else:
             self.progress_var.set("Missing dependencies detected.")
             self.progress_bar['value'] = 0
             
             result = messagebox.askyesno("Missing Dependencies", 
-                                       f"Missing required packages.\n\nWould you like to install them automatically?")
+                                       f"Missing required packages: {', '.join(missing)}\n\n"
+                                       "Would you like to install them automatically?")
             if result:
                 self.install_dependencies()
     
+    def _run_in_thread(self, target, *args):
+        """Run target(*args) on a daemon thread so the window keeps repainting"""
+        threading.Thread(target=target, args=args, daemon=True).start()
+    
+    def _post(self, msg):
+        """Queue a message from a worker thread and wake the UI if it isn't already due to drain"""
+        self._q.append(msg)
+        if self._pump_pending:
+            return
+        self._pump_pending = True
+        try:
+            self.root.event_generate("<<SetupMessage>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window closed or main loop exiting while pip was running;
+            # clear the flag so a later post can still schedule a pump
+            self._pump_pending = False
+    
+    def _pump(self):
+        """Drain queued worker messages (runs on <<SetupMessage>>)"""
+        self._pump_pending = False
+        while self._q:
+            msg_type, data = self._q.popleft()
+            if msg_type == "output":
+                line, percent = data
+                self.progress_var.set(line[:80])
+                if percent is not None:
+                    self.progress_bar['value'] = percent
+            elif msg_type == "installed":
+                self._finish_install(*data)
+            elif msg_type == "error":
+                self._finish_install(None, data)
+    
     def install_dependencies(self):
-        """Install Python dependencies"""
+        """Install Python dependencies (pip runs on a worker thread)"""
+        if self._installing:
+            return
+        self._installing = True
         self.progress_var.set("Installing dependencies...")
-        self.progress_bar['value'] = 30
-        self.root.update()
-        
+        total = count_requirements(REQUIREMENTS_FILE)
+        if total:
+            self.progress_bar['value'] = 5
+        else:
+            # Nothing to measure progress against; just show activity
+            self.progress_bar.configure(mode='indeterminate')
+            self.progress_bar.start(10)
+        self._run_in_thread(self._pip_install, total)
+    
+    def _pip_install(self, total):
+        """Worker: run pip, forwarding its output lines (and progress out of total packages) to the UI"""
+        import subprocess
         try:
-            # Install requirements
-            result = subprocess.run([sys.executable, "-m", "pip", "install", "-r", str(REQUIREMENTS_FILE)], 
-                                  capture_output=True, text=True, check=True)
-            
+            # --no-input: fail instead of waiting on a prompt nobody can answer;
+            # --disable-pip-version-check: skip pip's own PyPI lookup for a newer pip.
+            # pip is told to write UTF-8 and undecodable bytes are replaced, so a
+            # non-ASCII package message can't abort the read on cp1252 consoles
+            proc = subprocess.Popen([sys.executable, "-m", "pip", "install", "--no-input",
+                                     "--disable-pip-version-check", "-r", str(REQUIREMENTS_FILE)],
+                                    stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+                                    encoding="utf-8", errors="replace", bufsize=1)
+        except Exception as e:
+            self._post(("error", f"Unexpected error: {str(e)}"))
+            return
+        try:
+            output = deque(maxlen=20)  # Tail shown if pip fails
+            resolved = 0
+            for line in proc.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                output.append(line)
+                percent = None
+                if total:
+                    if _PIP_PACKAGE_LINE.match(line):
+                        # Transitive dependencies also show up here, so cap short of done
+                        resolved += 1
+                        percent = min(90, 5 + resolved * 85 // total)
+                    elif line.startswith(_PIP_INSTALLING_LINE):
+                        percent = 95
+                self._post(("output", (line, percent)))
+            self._post(("installed", (proc.wait(), "\n".join(output))))
+        except Exception as e:
+            self._post(("error", f"Unexpected error: {str(e)}"))
+        finally:
+            # Never leave pip running (or unreaped) if reading its output failed
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+    
+    def _finish_install(self, returncode, output):
+        """Report the pip result (UI thread)"""
+        self._installing = False
+        self.progress_bar.stop()
+        self.progress_bar.configure(mode='determinate')
+        if returncode == 0:
             self.progress_var.set("Dependencies installed successfully!")
             self.progress_bar['value'] = 100
             messagebox.showinfo("Success", "Dependencies installed successfully!")
-            
-        except subprocess.CalledProcessError as e:
-            self.progress_var.set("Failed to install dependencies.")
-            self.progress_bar['value'] = 0
-            messagebox.showerror("Error", f"Failed to install dependencies:\n{e.stderr}")
-        except Exception as e:
+        elif returncode is None:
             self.progress_var.set("Error during installation.")
             self.progress_bar['value'] = 0
-            messagebox.showerror("Error", f"Unexpected error: {str(e)}")
+            messagebox.showerror("Error", output)
+        else:
+            self.progress_var.set("Failed to install dependencies.")
+            self.progress_bar['value'] = 0
+            messagebox.showerror("Error", f"Failed to install dependencies:\n{output}")
     
     def validate_api_keys(self):
         """Validate that API keys are provided"""
@@ -241,21 +401,17 @@ class SetupGUI:
             # Read template if .env.mozart doesn't exist or if we have new keys
             if not ENV_FILE.exists() or not (self.openai_key.get().startswith('*') and self.deepseek_key.get().startswith('*')):
                 if ENV_EXAMPLE_FILE.exists():
-                    with open(ENV_EXAMPLE_FILE, 'r') as f:
-                        content = f.read()
+                    content = ENV_EXAMPLE_FILE.read_text(encoding='utf-8')
                 else:
                     content = self.get_default_env_content()
                 
                 # Replace API keys if they're not asterisks (existing keys)
-                if not self.openai_key.get().startswith('*'):
-                    content = content.replace('your_openai_api_key_here', self.openai_key.get().strip())
-                
-                if not self.deepseek_key.get().startswith('*'):
-                    content = content.replace('your_deepseek_api_key_here', self.deepseek_key.get().strip())
+                keys = {name: var.get().strip() for name, var in self._key_vars().items()
+                        if not var.get().startswith('*')}
+                content = fill_placeholders(content, keys)
                 
                 # Write to .env.mozart
-                with open(ENV_FILE, 'w') as f:
-                    f.write(content)
+                ENV_FILE.write_text(content, encoding='utf-8')
             
             self.progress_bar['value'] = 50
             self.root.update()
@@ -318,27 +474,37 @@ JUDGE_MODEL=gpt-4o
 """Launch Mozart Dueling AI"""
 import os
 import sys
-from pathlib import Path
 
-# Change to script directory
-os.chdir(Path(__file__).parent)
+# Change to script directory (skipped when already launched from there)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if os.getcwd() != _HERE:
+    os.chdir(_HERE)
 
-# Import and run Mozart
-try:
-    import mozart_monitorV10
-    if hasattr(mozart_monitorV10, 'main'):
-        mozart_monitorV10.main()
-    else:
-        # If no main function, run the GUI directly
-        print("Starting Mozart Dueling AI GUI...")
-        exec(open('mozart_monitorV10.py').read())
-except ImportError as e:
-    print(f"Error: {{e}}")
-    print("Please run setup.py first to install dependencies.")
-    sys.exit(1)
-except Exception as e:
-    print(f"Error starting Mozart: {{e}}")
-    sys.exit(1)
+
+def _run():
+    """Import and run Mozart (deferred so the GUI/HTTP stack only loads on launch)"""
+    try:
+        import mozart_monitorV10
+        main = getattr(mozart_monitorV10, 'main', None)
+        if main is not None:
+            main()
+        else:
+            # If no main function, run the module as a script so its
+            # __main__ block starts the GUI (cached bytecode is reused)
+            import runpy
+            print("Starting Mozart Dueling AI GUI...")
+            runpy.run_module("mozart_monitorV10", run_name="__main__")
+    except ImportError as e:
+        print(f"Error: {{e}}")
+        print("Please run setup.py first to install dependencies.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error starting Mozart: {{e}}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    _run()
 '''
         
         # Batch script
@@ -385,8 +551,8 @@ catch {{
         
         for filename, content in scripts:
             script_path = PROJECT_ROOT / filename
-            with open(script_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            if not write_if_changed(script_path, content):
+                continue  # Already up to date (e.g. setup re-run to change a key)
             
             # Make Python script executable on Unix systems
             if filename.endswith('.py'):